@@ -499,6 +499,9 @@ class Agent:
 				)
 			)
 
+			# 실행 중 추가된 액션 로그로 automation_log.json 생성
+			await self.controller.logger.afinalize()
+
 			if not self.injected_browser_context:
 				await self.browser_context.close()
 
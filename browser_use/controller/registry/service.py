@@ -10,6 +10,7 @@ from browser_use.controller.registry.views import (
 	ActionRegistry,
 	RegisteredAction,
 )
+from browser_use.dom.views import SelectorMap
 from browser_use.telemetry.service import ProductTelemetry
 from browser_use.telemetry.views import (
 	ControllerRegisteredFunctionsTelemetryEvent,
@@ -31,7 +32,7 @@ class Registry:
 		params = {
 			name: (param.annotation, ... if param.default == param.empty else param.default)
 			for name, param in sig.parameters.items()
-			if name != 'browser'
+			if name not in ('browser', 'selector_map')
 		}
 		# TODO: make the types here work
 		return create_model(
@@ -82,8 +83,17 @@ class Registry:
 
 		return decorator
 
-	async def execute_action(self, action_name: str, params: dict, browser: Optional[BrowserContext] = None) -> Any:
-		"""Execute a registered action"""
+	async def execute_action(
+		self,
+		action_name: str,
+		params: dict,
+		browser: Optional[BrowserContext] = None,
+		selector_map: Optional[SelectorMap] = None,
+	) -> Any:
+		"""Execute a registered action
+
+		@param selector_map: selector map already fetched by the caller, passed on to actions that accept a `selector_map` argument
+		"""
 		if action_name not in self.registry.actions:
 			raise ValueError(f'Action {action_name} not found')
 
@@ -97,6 +107,11 @@ class Registry:
 			parameters = list(sig.parameters.values())
 			is_pydantic = parameters and issubclass(parameters[0].annotation, BaseModel)
 
+			# Only hand the cached selector map to actions that ask for it
+			extra_kwargs = {}
+			if selector_map is not None and 'selector_map' in sig.parameters:
+				extra_kwargs['selector_map'] = selector_map
+
 			# Prepare arguments based on parameter type
 			if action.requires_browser:
 				if not browser:
@@ -104,8 +119,8 @@ class Registry:
 						f'Action {action_name} requires browser but none provided. This has to be used in combination of `requires_browser=True` when registering the action.'
 					)
 				if is_pydantic:
-					return await action.function(validated_params, browser=browser)
-				return await action.function(**validated_params.model_dump(), browser=browser)
+					return await action.function(validated_params, browser=browser, **extra_kwargs)
+				return await action.function(**validated_params.model_dump(), browser=browser, **extra_kwargs)
 
 			if is_pydantic:
 				return await action.function(validated_params)
@@ -1,10 +1,16 @@
 import asyncio
-import json
 import logging
+import os
+import time
 from typing import Optional, Type
 from datetime import datetime
+from urllib.parse import urlencode
 
+from bs4 import BeautifulSoup
+from html2text import html2text
 from main_content_extractor import MainContentExtractor
+from main_content_extractor.main_content_extractor import REMOVE_ELEMENT_LIST_DEFAULT
+from main_content_extractor.trafilatura_extends import TrafilaturaExtends
 from pydantic import BaseModel
 
 from browser_use.agent.views import ActionModel, ActionResult
@@ -23,11 +29,259 @@ from browser_use.controller.views import (
 	SendKeysAction,
 	SwitchTabAction,
 )
+from browser_use.dom.views import SelectorMap
 from browser_use.utils import time_execution_async, time_execution_sync
-from browser_use.playwright_logger import PlaywrightLogger
+from browser_use.playwright_logger import _IMPORTANT_ATTRS, _POST_ACTION_ATTRS, PlaywrightLogger
 
 logger = logging.getLogger(__name__)
 
+# 현재 페이지의 URL과 타이틀을 한 번의 evaluate로 가져오는 스크립트
+_JS_PAGE_URL_AND_TITLE = '() => [location.href, document.title]'
+
+# 실행 전 요소 상세 정보에 위치/크기와 가시성까지 기록하는 액션 (클릭 위치와 가려짐 여부가 결과를 좌우함)
+# 그 외 액션은 스타일/레이아웃 계산을 강제하지 않도록 이 값들을 수집하지 않음
+_LAYOUT_DETAIL_ACTIONS = frozenset(('click_element',))
+
+# 요소 상세 정보(태그, 텍스트, 가시성, 속성, 위치, XPath, CSS 선택자, 부모/자식 정보)를 한 번에 수집하는 스크립트
+# includeLayout이 false면 레이아웃 계산이 필요한 가시성과 위치/크기는 생략
+_JS_COLLECT_ELEMENT_DETAILS = """(el, [attrNames, includeLayout]) => {
+	const getXPath = function(element) {
+		if (element.id !== '') return '//*[@id="' + element.id + '"]';
+		if (element === document.body) return '/html/body';
+
+		let ix = 0;
+		const siblings = element.parentNode.childNodes;
+
+		for (let i = 0; i < siblings.length; i++) {
+			const sibling = siblings[i];
+			if (sibling === element) return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+			if (sibling.nodeType === 1 && sibling.tagName === element.tagName) ix++;
+		}
+	};
+
+	const getCssSelector = function(el) {
+		if (el.id) return '#' + el.id;
+		if (el.classList && el.classList.length > 0) return el.tagName.toLowerCase() + '.' + Array.from(el.classList).join('.');
+
+		// 기본 선택자
+		let selector = el.tagName.toLowerCase();
+
+		// 속성 추가
+		if (el.id) selector += '#' + el.id;
+		if (el.name) selector += '[name="' + el.name + '"]';
+
+		return selector;
+	};
+
+	const attributes = {};
+	for (const name of attrNames) {
+		const value = el.getAttribute(name);
+		if (value) attributes[name] = value;
+	}
+
+	const details = {
+		tag_name: el.tagName.toLowerCase(),
+		text_content: el.textContent,
+		inner_text: el.innerText || '',
+		is_enabled: !el.matches(':disabled'),
+		attributes: attributes,
+		xpath: getXPath(el),
+		css_selector: getCssSelector(el)
+	};
+
+	if (includeLayout) {
+		const rect = el.getBoundingClientRect();
+		const hasBox = el.getClientRects().length > 0;
+		details.is_visible = hasBox && rect.width > 0 && rect.height > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+		if (hasBox) {
+			details.position = {x: rect.x, y: rect.y};
+			details.size = {width: rect.width, height: rect.height};
+		}
+	}
+
+	const parent = el.parentElement;
+	if (parent) {
+		details.parent_info = {
+			tag_name: parent.tagName.toLowerCase(),
+			id: parent.id || null,
+			class_name: parent.className || null,
+			has_parent: !!parent.parentElement
+		};
+	}
+
+	const children = Array.from(el.children);
+	details.children_info = {
+		count: children.length,
+		tags: children.map(child => child.tagName.toLowerCase())
+	};
+
+	return details;
+}"""
+
+# 액션 실행 후 요소 상태(가시성, 활성화, 텍스트, 주요 속성)를 한 번에 다시 확인하는 스크립트
+_JS_COLLECT_POST_ACTION_DETAILS = """(el, attrNames) => {
+	const attributes = {};
+	for (const name of attrNames) {
+		const value = el.getAttribute(name);
+		if (value) attributes[name] = value;
+	}
+
+	const rect = el.getBoundingClientRect();
+	const style = window.getComputedStyle(el);
+
+	return {
+		is_visible: el.getClientRects().length > 0 && rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden',
+		is_enabled: !el.matches(':disabled'),
+		text_content: el.textContent,
+		attributes: attributes
+	};
+}"""
+
+
+# Scrolls vertically by the given number of pixels; the amount is passed as an argument, not formatted into the script
+_JS_SCROLL_BY = '(amount) => window.scrollBy(0, amount)'
+
+# Finds the first visible element containing the given text (case-insensitive, whitespace-normalized) and
+# scrolls it into view. Text nodes are tried first (like the old text= / contains(text()) locators), then the
+# deepest element whose rendered text contains it (like get_by_text, which also matches text split across children).
+# After scrolling it waits two animation frames (capped, as rAF is paused in background tabs) so the scroll is painted.
+_JS_SCROLL_TO_TEXT = """async (text) => {
+	const normalize = (value) => (value || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+	const needle = normalize(text);
+	if (!needle || !document.body) return false;
+
+	const isVisible = (el) => {
+		const rect = el.getBoundingClientRect();
+		const style = window.getComputedStyle(el);
+		return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+	};
+
+	let target = null;
+	const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+	while (walker.nextNode()) {
+		const el = walker.currentNode.parentElement;
+		if (el && normalize(walker.currentNode.textContent).includes(needle) && isVisible(el)) {
+			target = el;
+			break;
+		}
+	}
+
+	if (!target && normalize(document.body.innerText).includes(needle)) {
+		target = document.body;
+		let descended = true;
+		while (descended) {
+			descended = false;
+			for (const child of target.children) {
+				if (normalize(child.innerText).includes(needle) && isVisible(child)) {
+					target = child;
+					descended = true;
+					break;
+				}
+			}
+		}
+		if (target === document.body) target = null;
+	}
+
+	if (!target) return false;
+
+	const rect = target.getBoundingClientRect();
+	const inViewport = rect.top >= 0 && rect.left >= 0 && rect.bottom <= window.innerHeight && rect.right <= window.innerWidth;
+	if (!inViewport) {
+		target.scrollIntoView({block: 'center', inline: 'nearest'});
+		const nextFrame = () => new Promise((resolve) => requestAnimationFrame(resolve));
+		await Promise.race([
+			nextFrame().then(nextFrame),
+			new Promise((resolve) => setTimeout(resolve, 100))
+		]);
+	}
+	return true;
+}"""
+
+# Returns the options of the <select> matching the xpath in the frame it runs in, or null.
+# Options come back already formatted as `<index>: text=<json>`; the text is encoded like Python's
+# json.dumps (non-printable-ASCII escaped) so the LLM sees the same exact string as before.
+_JS_GET_DROPDOWN_OPTIONS = """(xpath) => {
+	const select = document.evaluate(xpath, document, null,
+		XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+	if (!select) return null;
+
+	// encoding ensures AI uses the exact string in select_dropdown_option
+	const encode = (text) => JSON.stringify(text).replace(/[\\u007f-\\uffff]/g,
+		(c) => '\\\\u' + c.charCodeAt(0).toString(16).padStart(4, '0'));
+
+	return {
+		// do not trim the text, because we are doing exact match in select_dropdown_option
+		options: Array.from(select.options).map(opt => `${opt.index}: text=${encode(opt.text)}`),
+		id: select.id,
+		name: select.name
+	};
+}"""
+
+# Finds the <select> matching the xpath and selects the option labelled `text` in one evaluate, the same way
+# Playwright's select_option(label=...) does: whitespace-normalized label match, the previous selection is cleared
+# (also for <select multiple>), then input/change are fired. Returns null if the frame doesn't contain the xpath
+_JS_SELECT_DROPDOWN_OPTION = """([xpath, text]) => {
+	const normalize = (value) => value.replace(/[\\u200b\\u00ad]/g, '').trim().replace(/\\s+/g, ' ');
+	const select = document.evaluate(xpath, document, null,
+		XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+	if (!select) return null;
+	if (select.tagName.toLowerCase() !== 'select') {
+		return {error: `Found element but it's a ${select.tagName}, not a SELECT`, found: false};
+	}
+	if (select.disabled) {
+		return {error: 'Select element is disabled', found: true, selected: false};
+	}
+
+	const normalizedText = normalize(text);
+	const option = Array.from(select.options).find(o => o.label === text || normalize(o.label) === normalizedText);
+	if (!option) {
+		return {error: `No option with label ${JSON.stringify(text)}`, found: true, selected: false};
+	}
+	if (option.disabled || (option.parentElement.tagName.toLowerCase() === 'optgroup' && option.parentElement.disabled)) {
+		return {error: `Option ${JSON.stringify(text)} is disabled`, found: true, selected: false};
+	}
+
+	select.value = undefined;
+	option.selected = true;
+	select.dispatchEvent(new Event('input', {bubbles: true, composed: true}));
+	select.dispatchEvent(new Event('change', {bubbles: true}));
+	return {
+		found: true,
+		selected: true,
+		values: Array.from(select.options).filter(o => o.selected).map(o => o.value)
+	};
+}"""
+
+
+def _extract_main_content(html: str, output_format: str) -> Optional[str]:
+	"""Same heuristics as MainContentExtractor.extract, but parsed with lxml instead of the pure-Python html.parser
+
+	Relies on MainContentExtractor's private helpers, so the dependency is pinned to an exact version and
+	tests/test_content_extraction.py checks that the result still matches MainContentExtractor.extract
+	"""
+	soup = BeautifulSoup(html, 'lxml')
+	soup = MainContentExtractor._remove_elements(soup, REMOVE_ELEMENT_LIST_DEFAULT)  # type: ignore
+
+	main_content = soup.find('main')
+	if main_content:
+		articles = main_content.find_all('article')  # type: ignore
+		result_html = ''.join(str(article) for article in articles) if articles else str(main_content)
+	else:
+		articles = soup.find_all('article')
+		if articles:
+			result_html = ''.join(str(article) for article in articles)
+		else:
+			main_content = MainContentExtractor._get_deepest_element_data(soup, ['contents', 'main'])  # type: ignore
+			result_html = str(main_content) if main_content else TrafilaturaExtends.extract(str(soup))
+
+	if not result_html:
+		return None
+
+	soup = BeautifulSoup(result_html, 'lxml')
+	if output_format == 'text':
+		return soup.get_text(strip=True)
+	return html2text(str(soup))
+
 
 class Controller:
 	def __init__(
@@ -39,8 +293,16 @@ class Controller:
 		self.exclude_actions = exclude_actions
 		self.output_model = output_model
 		self.registry = Registry(exclude_actions)
+		# xpath -> index of the frame the dropdown was last found in
+		self._xpath_frame_cache: dict[str, int] = {}
 		self._register_default_actions()
 		self.logger = PlaywrightLogger(log_dir=log_dir)
+		# 로그 위치가 명시적으로 지정된 경우에만 act()에서 요소 상세 정보를 수집 (CDP 호출 비용 절감)
+		self._collect_element_details = log_dir is not None or 'PLAYWRIGHT_LOG_DIR' in os.environ
+		# 직전 액션 종료 시점의 (URL, 타이틀). 다음 액션의 사전 조회를 대신함
+		self._last_seen: Optional[tuple[str, str]] = None
+		# 여러 태스크가 동시에 act()를 호출할 때 요소 정보 수집용 CDP 호출이 몰리지 않도록 동시 실행 수 제한
+		self._cdp_sem = asyncio.Semaphore(8)
 
 	def _register_default_actions(self):
 		"""Register all default browser actions"""
@@ -64,7 +326,7 @@ class Controller:
 		)
 		async def search_google(params: SearchGoogleAction, browser: BrowserContext):
 			page = await browser.get_current_page()
-			await page.goto(f'https://www.google.com/search?q={params.query}&udm=14')
+			await page.goto('https://www.google.com/search?' + urlencode({'q': params.query, 'udm': '14'}))
 			await page.wait_for_load_state()
 			msg = f'🔍  Searched for "{params.query}" in Google'
 			logger.info(msg)
@@ -88,14 +350,17 @@ class Controller:
 
 		# Element Interaction Actions
 		@self.registry.action('Click element', param_model=ClickElementAction, requires_browser=True)
-		async def click_element(params: ClickElementAction, browser: BrowserContext):
+		async def click_element(
+			params: ClickElementAction, browser: BrowserContext, selector_map: Optional[SelectorMap] = None
+		):
 			session = await browser.get_session()
-			state = session.cached_state
+			if selector_map is None:
+				selector_map = session.cached_state.selector_map
 
-			if params.index not in state.selector_map:
+			if params.index not in selector_map:
 				raise Exception(f'Element with index {params.index} does not exist - retry or use alternative actions')
 
-			element_node = state.selector_map[params.index]
+			element_node = selector_map[params.index]
 			initial_pages = len(session.context.pages)
 
 			# if element has file uploader then dont click
@@ -127,14 +392,14 @@ class Controller:
 			param_model=InputTextAction,
 			requires_browser=True,
 		)
-		async def input_text(params: InputTextAction, browser: BrowserContext):
-			session = await browser.get_session()
-			state = session.cached_state
+		async def input_text(params: InputTextAction, browser: BrowserContext, selector_map: Optional[SelectorMap] = None):
+			if selector_map is None:
+				selector_map = await browser.get_selector_map()
 
-			if params.index not in state.selector_map:
+			if params.index not in selector_map:
 				raise Exception(f'Element index {params.index} does not exist - retry or use alternative actions')
 
-			element_node = state.selector_map[params.index]
+			element_node = selector_map[params.index]
 			await browser._input_text_element_node(element_node, params.text)
 			msg = f'⌨️  Input "{params.text}" into index {params.index}'
 			logger.info(msg)
@@ -168,10 +433,7 @@ class Controller:
 		async def extract_content(params: ExtractPageContentAction, browser: BrowserContext):
 			page = await browser.get_current_page()
 			output_format = 'markdown' if params.include_links else 'text'
-			content = MainContentExtractor.extract(  # type: ignore
-				html=await page.content(),
-				output_format=output_format,
-			)
+			content = _extract_main_content(await page.content(), output_format)
 			msg = f'📄  Extracted page as {output_format}\n: {content}\n'
 			logger.info(msg)
 			return ActionResult(extracted_content=msg)
@@ -184,7 +446,7 @@ class Controller:
 		async def scroll_down(params: ScrollAction, browser: BrowserContext):
 			page = await browser.get_current_page()
 			if params.amount is not None:
-				await page.evaluate(f'window.scrollBy(0, {params.amount});')
+				await page.evaluate(_JS_SCROLL_BY, params.amount)
 			else:
 				await page.keyboard.press('PageDown')
 
@@ -205,7 +467,7 @@ class Controller:
 		async def scroll_up(params: ScrollAction, browser: BrowserContext):
 			page = await browser.get_current_page()
 			if params.amount is not None:
-				await page.evaluate(f'window.scrollBy(0, -{params.amount});')
+				await page.evaluate(_JS_SCROLL_BY, -params.amount)
 			else:
 				await page.keyboard.press('PageUp')
 
@@ -238,25 +500,11 @@ class Controller:
 		async def scroll_to_text(text: str, browser: BrowserContext):  # type: ignore
 			page = await browser.get_current_page()
 			try:
-				# Try different locator strategies
-				locators = [
-					page.get_by_text(text, exact=False),
-					page.locator(f'text={text}'),
-					page.locator(f"//*[contains(text(), '{text}')]"),
-				]
-
-				for locator in locators:
-					try:
-						# First check if element exists and is visible
-						if await locator.count() > 0 and await locator.first.is_visible():
-							await locator.first.scroll_into_view_if_needed()
-							await asyncio.sleep(0.5)  # Wait for scroll to complete
-							msg = f'🔍  Scrolled to text: {text}'
-							logger.info(msg)
-							return ActionResult(extracted_content=msg, include_in_memory=True)
-					except Exception as e:
-						logger.debug(f'Locator attempt failed: {str(e)}')
-						continue
+				# Locate the first visible element containing the text and scroll to it in a single round trip
+				if await page.evaluate(_JS_SCROLL_TO_TEXT, text):
+					msg = f'🔍  Scrolled to text: {text}'
+					logger.info(msg)
+					return ActionResult(extracted_content=msg, include_in_memory=True)
 
 				msg = f"Text '{text}' not found or not visible on page"
 				logger.info(msg)
@@ -271,56 +519,49 @@ class Controller:
 			description='Get all options from a native dropdown',
 			requires_browser=True,
 		)
-		async def get_dropdown_options(index: int, browser: BrowserContext) -> ActionResult:
+		async def get_dropdown_options(
+			index: int, browser: BrowserContext, selector_map: Optional[SelectorMap] = None
+		) -> ActionResult:
 			"""Get all options from a native dropdown"""
 			page = await browser.get_current_page()
-			selector_map = await browser.get_selector_map()
+			if selector_map is None:
+				selector_map = await browser.get_selector_map()
 			dom_element = selector_map[index]
 
+			def format_options(options: dict, frame_index: int) -> list[str]:
+				logger.debug(f'Found dropdown in frame {frame_index}')
+				logger.debug(f'Dropdown ID: {options["id"]}, Name: {options["name"]}')
+				return options['options']
+
 			try:
 				# Frame-aware approach since we know it works
 				all_options = []
-				frame_index = 0
+				frames = page.frames
 
-				for frame in page.frames:
+				# Try the frame this dropdown was found in last time before sweeping all frames
+				cached_frame_index = self._xpath_frame_cache.get(dom_element.xpath)
+				if cached_frame_index is not None and cached_frame_index < len(frames):
 					try:
-						options = await frame.evaluate(
-							"""
-							(xpath) => {
-								const select = document.evaluate(xpath, document, null,
-									XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-								if (!select) return null;
-
-								return {
-									options: Array.from(select.options).map(opt => ({
-										text: opt.text, //do not trim, because we are doing exact match in select_dropdown_option
-										value: opt.value,
-										index: opt.index
-									})),
-									id: select.id,
-									name: select.name
-								};
-							}
-						""",
-							dom_element.xpath,
-						)
-
+						options = await frames[cached_frame_index].evaluate(_JS_GET_DROPDOWN_OPTIONS, dom_element.xpath)
 						if options:
-							logger.debug(f'Found dropdown in frame {frame_index}')
-							logger.debug(f'Dropdown ID: {options["id"]}, Name: {options["name"]}')
-
-							formatted_options = []
-							for opt in options['options']:
-								# encoding ensures AI uses the exact string in select_dropdown_option
-								encoded_text = json.dumps(opt['text'])
-								formatted_options.append(f'{opt["index"]}: text={encoded_text}')
-
-							all_options.extend(formatted_options)
-
+							all_options.extend(format_options(options, cached_frame_index))
 					except Exception as frame_e:
-						logger.debug(f'Frame {frame_index} evaluation failed: {str(frame_e)}')
-
-					frame_index += 1
+						logger.debug(f'Cached frame {cached_frame_index} evaluation failed: {str(frame_e)}')
+					if not all_options:
+						self._xpath_frame_cache.pop(dom_element.xpath, None)
+
+				if not all_options:
+					# Probe all frames concurrently instead of one round trip per frame
+					frame_results = await asyncio.gather(
+						*(frame.evaluate(_JS_GET_DROPDOWN_OPTIONS, dom_element.xpath) for frame in frames),
+						return_exceptions=True,
+					)
+					for frame_index, options in enumerate(frame_results):
+						if isinstance(options, BaseException):
+							logger.debug(f'Frame {frame_index} evaluation failed: {str(options)}')
+						elif options:
+							self._xpath_frame_cache.setdefault(dom_element.xpath, frame_index)
+							all_options.extend(format_options(options, frame_index))
 
 				if all_options:
 					msg = '\n'.join(all_options)
@@ -346,10 +587,12 @@ class Controller:
 			index: int,
 			text: str,
 			browser: BrowserContext,
+			selector_map: Optional[SelectorMap] = None,
 		) -> ActionResult:
 			"""Select dropdown option by the text of the option you want to select"""
 			page = await browser.get_current_page()
-			selector_map = await browser.get_selector_map()
+			if selector_map is None:
+				selector_map = await browser.get_selector_map()
 			dom_element = selector_map[index]
 
 			# Validate that we're working with a select element
@@ -362,69 +605,57 @@ class Controller:
 			logger.debug(f'Element attributes: {dom_element.attributes}')
 			logger.debug(f'Element tag: {dom_element.tag_name}')
 
-			xpath = '//' + dom_element.xpath
-
-			try:
-				frame_index = 0
-				for frame in page.frames:
-					try:
-						logger.debug(f'Trying frame {frame_index} URL: {frame.url}')
-
-						# First verify we can find the dropdown in this frame
-						find_dropdown_js = """
-							(xpath) => {
-								try {
-									const select = document.evaluate(xpath, document, null,
-										XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-									if (!select) return null;
-									if (select.tagName.toLowerCase() !== 'select') {
-										return {
-											error: `Found element but it's a ${select.tagName}, not a SELECT`,
-											found: false
-										};
-									}
-									return {
-										id: select.id,
-										name: select.name,
-										found: true,
-										tagName: select.tagName,
-										optionCount: select.options.length,
-										currentValue: select.value,
-										availableOptions: Array.from(select.options).map(o => o.text.trim())
-									};
-								} catch (e) {
-									return {error: e.toString(), found: false};
-								}
-							}
-						"""
+			async def select_in_frame(frame, frame_index: int) -> Optional[ActionResult]:
+				try:
+					# Finding the dropdown and selecting the option happen in one evaluate, no locator round-trip
+					selection = await frame.evaluate(_JS_SELECT_DROPDOWN_OPTION, (dom_element.xpath, text))
 
-						dropdown_info = await frame.evaluate(find_dropdown_js, dom_element.xpath)
+					if selection:
+						if not selection.get('found'):
+							logger.error(f'Frame {frame_index} error: {selection.get("error")}')
+							return None
 
-						if dropdown_info:
-							if not dropdown_info.get('found'):
-								logger.error(f'Frame {frame_index} error: {dropdown_info.get("error")}')
-								continue
+						logger.debug(f'Found dropdown in frame {frame_index}')
+						self._xpath_frame_cache[dom_element.xpath] = frame_index
 
-							logger.debug(f'Found dropdown in frame {frame_index}: {dropdown_info}')
+						if not selection.get('selected'):
+							logger.error(f'Frame {frame_index} attempt failed: {selection.get("error")}')
+							return None
 
-							# "label" because we are selecting by text
-							# nth(0) to disable error thrown by strict mode
-							# timeout=1000 because we are already waiting for all network events, therefore ideally we don't need to wait a lot here (default 30s)
-							selected_option_values = (
-								await frame.locator('//' + dom_element.xpath).nth(0).select_option(label=text, timeout=1000)
-							)
+						selected_option_values = selection['values']
+						msg = f'selected option {text} with value {selected_option_values}'
+						logger.info(msg + f' in frame {frame_index}')
 
-							msg = f'selected option {text} with value {selected_option_values}'
-							logger.info(msg + f' in frame {frame_index}')
+						return ActionResult(extracted_content=msg, include_in_memory=True)
 
-							return ActionResult(extracted_content=msg, include_in_memory=True)
+				except Exception as frame_e:
+					logger.error(f'Frame {frame_index} attempt failed: {str(frame_e)}')
+					logger.error(f'Frame type: {type(frame)}')
+					logger.error(f'Frame URL: {frame.url}')
 
-					except Exception as frame_e:
-						logger.error(f'Frame {frame_index} attempt failed: {str(frame_e)}')
-						logger.error(f'Frame type: {type(frame)}')
-						logger.error(f'Frame URL: {frame.url}')
+				return None
 
-					frame_index += 1
+			try:
+				frames = page.frames
+
+				# Try the frame this dropdown was found in last time before sweeping all frames
+				cached_frame_index = self._xpath_frame_cache.pop(dom_element.xpath, None)
+				if cached_frame_index is not None and cached_frame_index < len(frames):
+					cached_frame = frames[cached_frame_index]
+					logger.debug(f'Trying cached frame {cached_frame_index} URL: {cached_frame.url}')
+					result = await select_in_frame(cached_frame, cached_frame_index)
+					if result is not None:
+						return result
+
+				# Try the remaining frames in order and stop at the first one that selects the option
+				# (frames are not probed concurrently, so the option is never selected in more than one frame)
+				for frame_index, frame in enumerate(frames):
+					if frame_index == cached_frame_index:
+						continue
+					logger.debug(f'Trying frame {frame_index} URL: {frame.url}')
+					result = await select_in_frame(frame, frame_index)
+					if result is not None:
+						return result
 
 				msg = f"Could not select option '{text}' in any frame"
 				logger.info(msg)
@@ -457,16 +688,23 @@ class Controller:
 		cached_path_hashes = set(e.hash.branch_path_hash for e in cached_selector_map.values())
 		await browser_context.remove_highlights()
 
+		# latest selector map, handed to the actions so they don't have to fetch it again
+		selector_map = cached_selector_map
+
 		for i, action in enumerate(actions):
 			if action.get_index() is not None and i != 0:
 				new_state = await browser_context.get_state()
-				new_path_hashes = set(e.hash.branch_path_hash for e in new_state.selector_map.values())
-				if check_for_new_elements and not new_path_hashes.issubset(cached_path_hashes):
+				# get_state re-draws the highlights, the loop start already removed the earlier ones
+				await browser_context.remove_highlights()
+				selector_map = new_state.selector_map
+				if check_for_new_elements and any(
+					e.hash.branch_path_hash not in cached_path_hashes for e in new_state.selector_map.values()
+				):
 					# next action requires index but there are new elements on the page
 					logger.info(f'Something new appeared after action {i} / {len(actions)}')
 					break
 
-			results.append(await self.act(action, browser_context))
+			results.append(await self.act(action, browser_context, selector_map=selector_map))
 
 			logger.debug(f'Executed action {i + 1} / {len(actions)}')
 			if results[-1].is_done or results[-1].error or i == len(actions) - 1:
@@ -478,13 +716,15 @@ class Controller:
 		return results
 
 	@time_execution_sync('--act')
-	async def act(self, action: ActionModel, browser_context: BrowserContext) -> ActionResult:
+	async def act(
+		self, action: ActionModel, browser_context: BrowserContext, selector_map: Optional[SelectorMap] = None
+	) -> ActionResult:
 		"""Execute an action"""
 		try:
-			# 디버깅 정보 출력
-			print("\n=== 디버깅: Controller.act 메서드 호출 ===")
-			print(f"액션: {action}")
-			print(f"액션 타입: {type(action)}")
+			# 디버그 로그가 꺼져 있으면 디버깅용 문자열 생성을 모두 건너뜀
+			_dbg = logger.isEnabledFor(logging.DEBUG)
+			if _dbg:
+				logger.debug('Controller.act 호출 - 액션: %s (타입: %s)', action, type(action))
 			
 			# 액션 정보 추출
 			element_index = None
@@ -496,23 +736,21 @@ class Controller:
 			
 			# 액션 파라미터에서 필요한 정보 추출
 			try:
-				# 액션 타입과 파라미터 추출
-				action_dict = action.model_dump(exclude_unset=True)
-				for name, parameters in action_dict.items():
+				# 액션 타입과 파라미터 추출 (전체 model_dump 대신 설정된 필드만 확인)
+				for name in action.__pydantic_fields_set__:
+					parameters = getattr(action, name)
 					if parameters is not None:
 						action_name = name
-						params = parameters
+						params = parameters.model_dump(exclude_unset=True)
 						break
 				
 				# 액션 타입에 따라 element_index 추출
 				if action_name == 'click_element' and isinstance(params, dict) and 'index' in params:
 					element_index = params['index']
-					print(f"디버깅: element_index = {element_index} (click_element)")
 				elif action_name == 'input_text' and isinstance(params, dict) and 'index' in params:
 					element_index = params['index']
-					print(f"디버깅: element_index = {element_index} (input_text)")
-				else:
-					print(f"디버깅: element_index = None (액션: {action_name})")
+				if _dbg:
+					logger.debug('디버깅: element_index = %s (액션: %s)', element_index, action_name)
 				
 				# 기타 파라미터 추출
 				if isinstance(params, dict):
@@ -523,140 +761,49 @@ class Controller:
 					if 'xpath' in params:
 						xpath = params['xpath']
 			except Exception as e:
-				print(f"디버깅: 액션 파라미터 추출 중 오류 발생: {str(e)}")
-			print("=== 디버깅 정보 끝 ===\n")
+				logger.debug('디버깅: 액션 파라미터 추출 중 오류 발생: %s', e)
 			
 			# PlaywrightLogger에 브라우저 컨텍스트 설정 (만약 설정되지 않았다면)
 			if self.logger.browser_context is None:
 				self.logger.browser_context = browser_context
 
 			# 현재 페이지 URL 및 타이틀 가져오기
+			# 직전 액션 이후 URL이 그대로면 그때 조회한 값을 재사용하고, 아니면 한 번의 evaluate로 조회
 			current_url = None
 			page_title = None
 			try:
 				page = await browser_context.get_current_page()
-				current_url = page.url
-				page_title = await page.title()
+				if self._last_seen is not None and self._last_seen[0] == page.url:
+					current_url, page_title = self._last_seen
+				else:
+					current_url, page_title = await page.evaluate(_JS_PAGE_URL_AND_TITLE)
 			except Exception as e:
 				logger.debug(f"Failed to get page info: {str(e)}")
 			
 			# 요소 상세 정보 수집 (Playwright ElementHandle 사용)
 			element_details = {}
-			if element_index is not None:
+			if self._collect_element_details and element_index is not None:
 				try:
-					# 브라우저 컨텍스트를 통해 요소 핸들 가져오기
-					element_handle = await browser_context.get_element_by_index(element_index)
-					print(f"디버깅: element_handle = {element_handle}")
-					
-					if element_handle:
-						# 요소의 상세 정보 수집
-						element_details = {
-							"index": element_index,
-							"tag_name": await element_handle.evaluate("el => el.tagName.toLowerCase()"),
-							"text_content": await element_handle.text_content(),
-							"inner_text": await element_handle.evaluate("el => el.innerText || ''"),
-							"is_visible": await element_handle.is_visible(),
-							"is_enabled": await element_handle.is_enabled(),
-							"attributes": {}
-						}
-						
-						print(f"디버깅: element_details = {element_details}")
-						
-						# 중요 속성 수집
-						for attr in ['id', 'class', 'name', 'type', 'value', 'href', 'src', 'placeholder', 'aria-label', 'role', 'title', 'alt', 'data-testid']:
-							value = await element_handle.get_attribute(attr)
-							if value:
-								element_details["attributes"][attr] = value
-								print(f"디버깅: 속성 {attr} = {value}")
-						
-						# 요소의 위치와 크기 정보 수집
-						bbox = await element_handle.bounding_box()
-						if bbox:
-							element_details["position"] = {'x': bbox['x'], 'y': bbox['y']}
-							element_details["size"] = {'width': bbox['width'], 'height': bbox['height']}
-						
-						# XPath 생성
-						element_details["xpath"] = await element_handle.evaluate("""el => {
-							const getXPath = function(element) {
-								if (element.id !== '') return '//*[@id="' + element.id + '"]';
-								if (element === document.body) return '/html/body';
-								
-								let ix = 0;
-								const siblings = element.parentNode.childNodes;
-								
-								for (let i = 0; i < siblings.length; i++) {
-									const sibling = siblings[i];
-									if (sibling === element) return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-									if (sibling.nodeType === 1 && sibling.tagName === element.tagName) ix++;
-								}
-							};
-							return getXPath(el);
-						}""")
-						
-						# CSS 선택자 생성
-						element_details["css_selector"] = await element_handle.evaluate("""el => {
-							const getCssSelector = function(el) {
-								if (el.id) return '#' + el.id;
-								if (el.classList && el.classList.length > 0) return el.tagName.toLowerCase() + '.' + Array.from(el.classList).join('.');
-								
-								// 기본 선택자
-								let selector = el.tagName.toLowerCase();
-								
-								// 속성 추가
-								if (el.id) selector += '#' + el.id;
-								if (el.name) selector += '[name="' + el.name + '"]';
-								
-								return selector;
-							};
-							return getCssSelector(el);
-						}""")
-						
-						print(f"디버깅: xpath = {element_details['xpath']}")
-						print(f"디버깅: css_selector = {element_details['css_selector']}")
-						
-						# 부모 요소 정보 수집
-						try:
-							parent_info = await element_handle.evaluate("""el => {
-								const parent = el.parentElement;
-								if (!parent) return null;
-								
-								return {
-									tag_name: parent.tagName.toLowerCase(),
-									id: parent.id || null,
-									class_name: parent.className || null,
-									has_parent: !!parent.parentElement
-								};
-							}""")
-							
-							if parent_info:
-								element_details["parent_info"] = parent_info
-								print(f"디버깅: parent_info = {parent_info}")
-						except Exception as e:
-							logger.debug(f"Failed to get parent info: {str(e)}")
-						
-						# 자식 요소 정보 수집
-						try:
-							children_info = await element_handle.evaluate("""el => {
-								const children = Array.from(el.children);
-								return {
-									count: children.length,
-									tags: children.map(child => child.tagName.toLowerCase())
-								};
-							}""")
-							
-							if children_info:
-								element_details["children_info"] = children_info
-								print(f"디버깅: children_info = {children_info}")
-						except Exception as e:
-							logger.debug(f"Failed to get children info: {str(e)}")
+					async with self._cdp_sem:
+						# 브라우저 컨텍스트를 통해 요소 핸들 가져오기
+						element_handle = await browser_context.get_element_by_index(element_index)
 						
-						logger.debug(f"Collected detailed element info for index {element_index}")
+						if element_handle:
+							# 요소의 상세 정보를 한 번의 evaluate 호출로 수집
+							element_details = {
+								"index": element_index,
+								**await element_handle.evaluate(
+									_JS_COLLECT_ELEMENT_DETAILS,
+									[_IMPORTANT_ATTRS, action_name in _LAYOUT_DETAIL_ACTIONS],
+								),
+							}
+					
+					if _dbg and element_details:
+						logger.debug('Collected detailed element info for index %s: %s', element_index, element_details)
 				except Exception as e:
-					logger.debug(f"Failed to collect element details: {str(e)}")
-					print(f"디버깅 예외: {str(e)}")
+					logger.debug('Failed to collect element details: %s', e)
 			
 			# 액션 실행 전 로깅 (상세 정보 포함)
-			print(f"디버깅: log_action_before_execute 호출 전 - element_index={element_index}, selector={element_details.get('css_selector') if element_details else None}")
 			pre_action_element_info = await self.logger.log_action_before_execute(
 				action_type=action_name,
 				element_index=element_index,
@@ -665,48 +812,53 @@ class Controller:
 				text=text,
 				url=url
 			)
-			print(f"디버깅: log_action_before_execute 호출 후 - pre_action_element_info={pre_action_element_info}")
+			if _dbg:
+				logger.debug('디버깅: pre_action_element_info = %s', pre_action_element_info)
 			
 			# 요소 상세 정보가 있으면 로그 파일에 추가 기록
 			if element_details:
-				with open(self.logger.log_file, 'a', encoding='utf-8') as f:
-					f.write(f"=== PRE-ACTION ELEMENT DETAILS: {action_name} - {datetime.now().isoformat()} ===\n")
-					f.write(f"Element Index: {element_index}\n")
-					f.write(f"Tag: {element_details.get('tag_name', 'unknown')}\n")
-					f.write(f"Text Content: {element_details.get('text_content', '')[:200]}\n")
-					f.write(f"Is Visible: {element_details.get('is_visible', False)}\n")
-					f.write(f"Is Enabled: {element_details.get('is_enabled', False)}\n")
-					
-					if "attributes" in element_details:
-						f.write("Attributes:\n")
-						for key, value in element_details["attributes"].items():
-							f.write(f"  {key}: {value}\n")
-					
-					if "position" in element_details:
-						f.write(f"Position: x={element_details['position']['x']}, y={element_details['position']['y']}\n")
-					
-					if "size" in element_details:
-						f.write(f"Size: width={element_details['size']['width']}, height={element_details['size']['height']}\n")
-					
-					if "xpath" in element_details:
-						f.write(f"XPath: {element_details['xpath']}\n")
-					
-					if "css_selector" in element_details:
-						f.write(f"CSS Selector: {element_details['css_selector']}\n")
-					
-					if "parent_info" in element_details:
-						f.write("Parent Element:\n")
-						for key, value in element_details["parent_info"].items():
-							f.write(f"  {key}: {value}\n")
-					
-					if "children_info" in element_details:
-						f.write(f"Children Count: {element_details['children_info']['count']}\n")
-						f.write(f"Children Tags: {', '.join(element_details['children_info']['tags'])}\n")
-					
-					f.write("-" * 80 + "\n\n")
+				# 로거가 실행 전 요소 정보에 남긴 타임스탬프를 재사용
+				detail_time = (pre_action_element_info or {}).get("timestamp") or datetime.now().isoformat()
+				lines = []
+				lines.append(f"=== PRE-ACTION ELEMENT DETAILS: {action_name} - {detail_time} ===\n")
+				lines.append(f"Element Index: {element_index}\n")
+				lines.append(f"Tag: {element_details.get('tag_name', 'unknown')}\n")
+				lines.append(f"Text Content: {element_details.get('text_content', '')[:200]}\n")
+				if "is_visible" in element_details:
+					lines.append(f"Is Visible: {element_details['is_visible']}\n")
+				lines.append(f"Is Enabled: {element_details.get('is_enabled', False)}\n")
+				
+				if "attributes" in element_details:
+					lines.append("Attributes:\n")
+					for key, value in element_details["attributes"].items():
+						lines.append(f"  {key}: {value}\n")
+				
+				if "position" in element_details:
+					lines.append(f"Position: x={element_details['position']['x']}, y={element_details['position']['y']}\n")
+				
+				if "size" in element_details:
+					lines.append(f"Size: width={element_details['size']['width']}, height={element_details['size']['height']}\n")
+				
+				if "xpath" in element_details:
+					lines.append(f"XPath: {element_details['xpath']}\n")
+				
+				if "css_selector" in element_details:
+					lines.append(f"CSS Selector: {element_details['css_selector']}\n")
+				
+				if "parent_info" in element_details:
+					lines.append("Parent Element:\n")
+					for key, value in element_details["parent_info"].items():
+						lines.append(f"  {key}: {value}\n")
+				
+				if "children_info" in element_details:
+					lines.append(f"Children Count: {element_details['children_info']['count']}\n")
+					lines.append(f"Children Tags: {', '.join(element_details['children_info']['tags'])}\n")
+				
+				lines.append("-" * 80 + "\n\n")
+				self.logger.write_log("".join(lines))
 			
 			# 액션 실행 시작 시간 기록
-			start_time = datetime.now()
+			start_time = time.perf_counter()
 			
 			# 액션 실행
 			result = None
@@ -714,11 +866,10 @@ class Controller:
 			action_result = None
 			
 			try:
-				# 하이라이트 제거
-				await browser_context.remove_highlights()
-				
 				# 액션 실행
-				result = await self.registry.execute_action(action_name, params, browser=browser_context)
+				result = await self.registry.execute_action(
+					action_name, params, browser=browser_context, selector_map=selector_map
+				)
 				
 				# 결과 처리
 				if isinstance(result, str):
@@ -740,40 +891,36 @@ class Controller:
 			
 			finally:
 				# 액션 실행 종료 시간 및 소요 시간 계산
-				end_time = datetime.now()
-				duration_ms = (end_time - start_time).total_seconds() * 1000
+				duration_ms = (time.perf_counter() - start_time) * 1000.0
 				
 				# 페이지 변경 여부 확인
 				page_changed = False
 				new_url = None
 				new_title = None
+				self._last_seen = None
 				try:
 					page = await browser_context.get_current_page()
-					new_url = page.url
-					new_title = await page.title()
+					new_url, new_title = await page.evaluate(_JS_PAGE_URL_AND_TITLE)
+					if error is None:
+						self._last_seen = (new_url, new_title)
 					page_changed = (current_url != new_url) or (page_title != new_title)
+					if current_url != new_url:
+						# 페이지 이동 시 프레임 구성이 바뀌므로 드롭다운 프레임 캐시 무효화
+						self._xpath_frame_cache.clear()
 				except Exception as e:
 					logger.debug(f"Failed to check page change: {str(e)}")
 				
 				# 액션 실행 후 요소 상태 확인 (가능한 경우)
 				post_action_element_details = {}
-				if element_index is not None and not page_changed:
+				if self._collect_element_details and element_index is not None and not page_changed:
 					try:
-						element_handle = await browser_context.get_element_by_index(element_index)
-						if element_handle:
-							# 요소의 상태 변화 확인
-							post_action_element_details = {
-								"is_visible": await element_handle.is_visible(),
-								"is_enabled": await element_handle.is_enabled(),
-								"text_content": await element_handle.text_content(),
-								"attributes": {}
-							}
-							
-							# 중요 속성 수집
-							for attr in ['value', 'class', 'style']:
-								value = await element_handle.get_attribute(attr)
-								if value:
-									post_action_element_details["attributes"][attr] = value
+						async with self._cdp_sem:
+							element_handle = await browser_context.get_element_by_index(element_index)
+							if element_handle:
+								# 요소의 상태 변화와 중요 속성을 한 번의 evaluate 호출로 확인
+								post_action_element_details = await element_handle.evaluate(
+									_JS_COLLECT_POST_ACTION_DETAILS, _POST_ACTION_ATTRS
+								)
 					except Exception as e:
 						logger.debug(f"Failed to collect post-action element details: {str(e)}")
 				
@@ -1,13 +1,23 @@
+import asyncio
+import atexit
 import json
 import logging
 import os
 import shutil
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from browser_use.browser.context import BrowserContext  # BrowserContext 클래스 임포트
 from browser_use.dom.views import DOMElementNode  # DOMElementNode 클래스 임포트
 
+try:
+    import orjson
+except ImportError:  # 의존성에 포함되어 있지만, 설치되지 않은 환경에서는 표준 json 모듈로 직렬화
+    orjson = None
+
 # 로거 설정
 logger = logging.getLogger("playwright_automation")
 logger.setLevel(logging.INFO)
@@ -25,13 +35,161 @@ DEFAULT_LOG_DIR = os.environ.get("PLAYWRIGHT_LOG_DIR", os.path.expanduser("~/pla
 # 결과 텍스트 최대 출력 길이 설정 (기본값: 200자)
 MAX_RESULT_LENGTH = int(os.environ.get("PLAYWRIGHT_MAX_RESULT_LENGTH", "200"))
 
+# 요소 정보와 JSON 로그에 기록하는 중요 속성 목록 (Controller.act()가 실행 전 요소 상세 정보를 수집할 때도 사용)
+_IMPORTANT_ATTRS = (
+    'id', 'class', 'name', 'type', 'value', 'href', 'src', 'placeholder', 'aria-label', 'role', 'title', 'alt', 'data-testid'
+)
+# Controller.act()가 액션 실행 후 변화를 확인할 속성 목록
+_POST_ACTION_ATTRS = ('value', 'class', 'style')
+# 텍스트 로그의 ELEMENT DETAILS 블록에 기록하는 속성 목록
+_LOG_TEXT_ATTRS = ('id', 'class', 'name', 'type', 'value', 'href', 'src', 'aria-label', 'role', 'title')
+# formatted_actions의 element_info에 그대로 옮기는 요소 정보 키 (있는 경우에만, 이 순서로)
+_FORMATTED_ELEMENT_KEYS = ('text_content', 'inner_text', 'has_parent', 'children_count', 'children_tags')
+# 대상 요소의 상태를 바꿀 수 있는 액션 (그 외 액션은 실행 후 요소 정보를 다시 수집하지 않음)
+_ELEMENT_MUTATING_ACTIONS = frozenset(('click_element', 'input_text', 'select_dropdown_option'))
+# id/class 다음으로 CSS 선택자에 쓰는 속성 (우선순위 순서, tag[attr='value'] 형태로 사용)
+_CSS_SELECTOR_ATTRS = ('name', 'data-testid', 'aria-label')
+# 액션 전후의 DOM 요소 정보 수집 여부 (기본값: 1, "0"이면 요소 정보와 변경 사항 기록을 생략)
+COLLECT_ELEMENT_INFO = os.environ.get("PLAYWRIGHT_COLLECT_ELEMENT_INFO", "1") == "1"
+# 들여쓰기 2칸으로 저장한 automation_log.json의 끝부분 (formatted_actions 배열이 비어 있지 않을 때)
+_JSON_ACTIONS_TAIL = b"\n  ]\n}"
+# 빈 자리 원소 하나를 넣어 직렬화한 formatted_actions 배열의 원소 부분 (앞부분만 잘라 쓰기 위한 표식)
+_JSON_ACTIONS_PLACEHOLDER = b"    null"
+# 액션 진행 상황을 콘솔에 출력할지 여부 (기본값: 1, "0"이면 logger 출력만 남김)
+VERBOSE = os.environ.get("PLAYWRIGHT_VERBOSE", "1") == "1"
+# 몇 개의 액션마다 로그 파일 버퍼를 내보낼지 (기본값: 32, 0이면 finalize()/close() 때만 내보냄)
+FLUSH_EVERY = int(os.environ.get("PLAYWRIGHT_FLUSH_EVERY", "32"))
+# _generate_css_selector 결과 캐시의 최대 항목 수
+_CSS_CACHE_SIZE = 1024
+
+
+def _json_default(obj: Any) -> Any:
+    """표준 json 모듈이 직렬화하지 못하는 datetime을 ISO 문자열로 변환"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any) -> bytes:
+    """
+    JSON 로그용 직렬화. orjson이 있으면 orjson을, 없으면 표준 json 모듈을 사용합니다.
+    
+    Args:
+        data: 직렬화할 데이터 (datetime은 ISO 형식 문자열로 기록)
+        
+    Returns:
+        들여쓰기 2칸의 UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+
+
+def _dump_json_line(data: Any) -> bytes:
+    """
+    JSON Lines 로그용 직렬화 (한 줄짜리 JSON + 줄바꿈)
+    
+    Args:
+        data: 직렬화할 데이터
+        
+    Returns:
+        줄바꿈으로 끝나는 UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    # orjson 출력과 같이 공백 없는 구분자 사용
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode('utf-8') + b"\n"
+
+
+def _dump_json_action(action: Dict[str, Any]) -> bytes:
+    """
+    automation_log.json의 formatted_actions 배열 원소 하나를 직렬화합니다.
+    
+    Args:
+        action: 포맷팅된 액션
+        
+    Returns:
+        배열 원소 들여쓰기(4칸)에 맞춘 UTF-8 JSON 바이트 (구분자 제외)
+    """
+    # JSON 문자열 안의 줄바꿈은 이스케이프되어 있으므로 그대로 바꿔도 안전
+    return b"    " + _dump_json(action).replace(b"\n", b"\n    ")
+
+
+# _now_iso가 마지막으로 포맷한 (초, "YYYY-MM-DDTHH:MM:SS") 값. 같은 초 안에서는 날짜/시각 부분을 다시 포맷하지 않음
+_iso_second_cache = (None, "")
+
+
+def _now_iso() -> str:
+    """
+    현재 로컬 시각을 datetime.now().isoformat()과 같은 형식(마이크로초 포함)으로 반환합니다.
+    datetime 객체를 만들지 않고, 초 단위까지의 문자열은 같은 초 동안 재사용합니다.
+    
+    Returns:
+        ISO 형식 타임스탬프 문자열
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _iso_second_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+def _truncating_opener(path: str, flags: int) -> int:
+    """'a'/'ab' 모드로 열 때 사용: 파일을 한 번 비우고 O_APPEND로 엶 (open()의 opener 인자)"""
+    return os.open(path, flags | os.O_TRUNC, 0o666)
+
+
+def _report_write_error(future: Future) -> None:
+    """I/O 스레드에서 실패한 로그 쓰기를 보고"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to write log: {str(error)}")
+
+
+def _release_io(io_executor: ThreadPoolExecutor, log_fp, json_fp) -> None:
+    """
+    close() 없이 수거된 로거의 I/O 스레드와 파일 핸들을 정리합니다. (weakref.finalize 콜백이므로 로거를 참조하지 않음)
+    남은 쓰기를 모두 처리한 뒤 I/O 스레드에서 핸들을 닫고, 그 뒤 스레드가 종료됩니다.
+    
+    Args:
+        io_executor: 로거의 I/O 스레드
+        log_fp: 텍스트 로그 파일 핸들
+        json_fp: JSON Lines 로그 파일 핸들
+    """
+    def close_files() -> None:
+        log_fp.close()
+        json_fp.close()
+    
+    try:
+        io_executor.submit(close_files).add_done_callback(_report_write_error)
+    except RuntimeError:
+        # 인터프리터 종료 중이면 I/O 스레드가 이미 남은 작업을 끝냈으므로 직접 닫음
+        close_files()
+    io_executor.shutdown(wait=False)
+
+
+# 아직 닫히지 않은 로거 (약한 참조만 보관). 인터프리터 종료 시 _close_live_loggers가 마무리
+_live_loggers: "weakref.WeakSet[PlaywrightLogger]" = weakref.WeakSet()
+
+
+def _close_live_loggers() -> None:
+    """인터프리터 종료 시(atexit) 아직 닫히지 않은 로거의 남은 기록과 automation_log.json을 마무리"""
+    for playwright_logger in list(_live_loggers):
+        playwright_logger.close()
+
+
+atexit.register(_close_live_loggers)
+
 
 class PlaywrightLogger:
     """
     Playwright 자동화 코드 생성을 위한 로깅 클래스
     """
 
-    def __init__(self, log_dir: Optional[str] = None, session_id: Optional[str] = None, browser_context: Optional[BrowserContext] = None):
+    def __init__(self, log_dir: Optional[str] = None, session_id: Optional[str] = None, browser_context: Optional[BrowserContext] = None,
+                 flush_interval_actions: Optional[int] = None):
         """
         로거 초기화
         
@@ -39,38 +197,44 @@ class PlaywrightLogger:
             log_dir: 로그 파일을 저장할 디렉토리 경로
             session_id: 사용하지 않음 (호환성을 위해 유지)
             browser_context: BrowserContext 인스턴스
+            flush_interval_actions: 몇 개의 액션마다 로그 버퍼를 파일로 내보낼지 (None이면 PLAYWRIGHT_FLUSH_EVERY, 0이면 finalize() 때만)
         """
         self.log_dir = log_dir or DEFAULT_LOG_DIR
         self.session_id = "current"  # 항상 "current"를 사용
         self.browser_context = browser_context  # BrowserContext 인스턴스 저장
+        # False이면 액션마다 콘솔에 출력하지 않음 (오류는 logger를 통해 계속 출력됨)
+        self.verbose: bool = VERBOSE
+        # 비정상 종료 시 잃을 수 있는 기록은 최대 이 수만큼의 액션 (fsync는 finalize()에서만 수행)
+        self.flush_interval_actions: int = FLUSH_EVERY if flush_interval_actions is None else flush_interval_actions
         
         # 로그 디렉토리 생성
         try:
-            self.session_dir = self.log_dir  # session_dir을 log_dir과 동일하게 설정
+            # session_dir을 log_dir과 동일하게 설정 (절대 경로로 한 번만 변환해 이후 경로는 모두 절대 경로)
+            self.session_dir = os.path.abspath(self.log_dir)
             os.makedirs(self.session_dir, exist_ok=True)
-            
-            # 로그 디렉토리 전체 경로 출력
-            abs_log_dir = os.path.abspath(self.session_dir)
-            logger.info(f"Log directory created/verified: {abs_log_dir}")
-            print(f"\n===> Log directory: {abs_log_dir}")
+            logger.info(f"Log directory created/verified: {self.session_dir}")
         except Exception as e:
             logger.error(f"Failed to create log directory: {str(e)}")
             print(f"\n===> ERROR: Failed to create log directory: {str(e)}")
             # 기본 디렉토리로 폴백
-            self.session_dir = os.path.expanduser("~/playwright_logs")
+            self.session_dir = os.path.abspath(os.path.expanduser("~/playwright_logs"))
             os.makedirs(self.session_dir, exist_ok=True)
-            print(f"\n===> Using fallback log directory: {os.path.abspath(self.session_dir)}")
+            print(f"\n===> Using fallback log directory: {self.session_dir}")
         
         # 로그 파일 경로 - 통합 로그 파일 사용
         self.log_file = os.path.join(self.session_dir, "automation_log.log")
         self.json_log_file = os.path.join(self.session_dir, "automation_log.json")
+        # 액션마다 한 줄씩 추가하는 JSON Lines 로그 (automation_log.json은 finalize()에서 한 번에 생성)
+        self.jsonl_log_file = os.path.join(self.session_dir, "automation_log.jsonl")
         
-        # 로그 파일 전체 경로 출력
-        abs_log_file = os.path.abspath(self.log_file)
-        abs_json_log_file = os.path.abspath(self.json_log_file)
-        print(f"\n===> Log files will be saved to:")
-        print(f"     Text log: {abs_log_file}")
-        print(f"     JSON log: {abs_json_log_file}\n")
+        # 로그 파일 전체 경로 출력 (session_dir이 절대 경로이므로 그대로 출력)
+        if self.verbose:
+            print(
+                f"\n===> Log files will be saved to:\n"
+                f"     Text log: {self.log_file}\n"
+                f"     JSON log: {self.json_log_file}\n"
+                f"     JSON lines log: {self.jsonl_log_file}\n"
+            )
         
         # 현재 시간을 포함한 타임스탬프 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -82,6 +246,14 @@ class PlaywrightLogger:
             logger.error(f"Error during log file backup: {str(e)}")
             print(f"===> ERROR: Could not backup existing log files: {str(e)}")
         
+        # 텍스트 로그 파일은 세션 동안 열어두고 재사용 (액션마다 open/close 하지 않음)
+        # 모든 기록이 이 핸들을 거치므로 64KB 버퍼로 모아서 쓰고, flush_interval_actions개 액션마다와 finalize()/close()에서 내보냄
+        # 기존 파일은 백업으로 복사해 두었으므로 열 때 한 번만 비우고, 이후 쓰기는 O_APPEND로 항상 파일 끝에 기록
+        # (같은 디렉토리를 쓰는 다른 로거가 파일을 비워도 예전 위치에 이어 써서 NUL 바이트로 채우지 않음)
+        self._log_fp = open(self.log_file, 'a', encoding='utf-8', buffering=1 << 16, opener=_truncating_opener)
+        # JSON Lines 로그도 세션 동안 열어두고 액션마다 한 줄씩 추가 (같은 64KB 버퍼로 write 호출을 묶음)
+        self._json_fp = open(self.jsonl_log_file, 'ab', buffering=1 << 16, opener=_truncating_opener)
+        
         # 새 로그 파일 초기화
         try:
             self._initialize_log_files()
@@ -89,56 +261,93 @@ class PlaywrightLogger:
             logger.error(f"Error initializing log files: {str(e)}")
             print(f"===> ERROR: Could not initialize log files: {str(e)}")
         
-        # 액션 로그 초기화
-        self.actions = []
+        # 파일 쓰기는 전용 스레드 하나에서 순서대로 처리해 이벤트 루프를 막지 않음
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright_logger_io")
+        self._closed = False
+        # 마지막으로 버퍼를 내보낸 뒤 기록한 액션 수
+        self._actions_since_flush = 0
+        # close()를 부르지 않고 종료해도 버퍼에 남은 기록과 automation_log.json이 남도록 함 (약한 참조라서 수명은 늘리지 않음)
+        _live_loggers.add(self)
+        # close() 없이 수거되면 I/O 스레드와 파일 핸들을 정리 (실행마다 Controller를 만들어도 스레드/fd가 쌓이지 않음)
+        self._finalizer = weakref.finalize(self, _release_io, self._io_executor, self._log_fp, self._json_fp)
+        # 종료 시에는 _close_live_loggers가 automation_log.json까지 마무리하므로 finalize 콜백은 atexit에서 실행하지 않음
+        self._finalizer.atexit = False
+        
+        # False이면 store_element_info를 호출하지 않음 (요소 인덱스만 기록)
+        self.collect_element_info: bool = COLLECT_ELEMENT_INFO
+        
+        # 액션 로그 초기화 - 메모리에는 포맷팅된 기록만 보관 (원본 기록은 JSON Lines 로그에 있음)
+        self._formatted_actions = []
+        # (태그, id, class, name, data-testid, aria-label) -> CSS 선택자
+        self._css_cache: Dict[tuple, Optional[str]] = {}
+        # 요소 인덱스 -> (수집 당시의 selector_map, 요소 정보). 한 액션(pre/post) 동안만 유지
+        self._elem_info_cache: Dict[int, tuple] = {}
+        # finalize() 이후 새로 추가된 액션이 있는지 여부
+        self._json_dirty = False
+        # post-action 기록과 함께 내보내려고 보류 중인 pre-action 기록 (포맷팅된 기록, 직렬화된 줄)
+        self._pending_json: Optional[Tuple[Dict[str, Any], bytes]] = None
+        # automation_log.json에 이미 기록된 formatted_actions 수 (다음 저장 때는 그 뒤의 액션만 덧붙임)
+        self._json_saved_count = 0
         
         # 초기화 완료 메시지
-        print(f"===> PlaywrightLogger initialized successfully")
+        if self.verbose:
+            print(f"===> PlaywrightLogger initialized successfully")
     
     def _backup_existing_logs(self, timestamp: str) -> None:
         """
-        기존 로그 파일을 백업합니다.
+        기존 로그 파일을 백업합니다 (없는 파일은 건너뜀).
+        같은 디렉토리를 쓰는 다른 로거가 아직 파일을 열고 있을 수 있으므로 이름을 바꾸지 않고 복사합니다.
         
         Args:
             timestamp: 백업 파일에 포함할 타임스탬프
         """
         # 텍스트 로그 파일 백업
-        if os.path.exists(self.log_file):
-            try:
-                backup_log_path = os.path.join(self.session_dir, f"automation_log_{timestamp}.log")
-                shutil.copy2(self.log_file, backup_log_path)
-                abs_backup_path = os.path.abspath(backup_log_path)
-                logger.info(f"Backed up log file to: {abs_backup_path}")
-                print(f"===> Backed up text log to: {abs_backup_path}")
-            except Exception as e:
-                logger.warning(f"Failed to backup log file: {str(e)}")
-                print(f"===> WARNING: Failed to backup text log: {str(e)}")
+        try:
+            backup_log_path = os.path.join(self.session_dir, f"automation_log_{timestamp}.log")
+            shutil.copy2(self.log_file, backup_log_path)
+            logger.info(f"Backed up log file to: {backup_log_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to backup log file: {str(e)}")
+            print(f"===> WARNING: Failed to backup text log: {str(e)}")
         
         # JSON 로그 파일 백업
-        if os.path.exists(self.json_log_file):
-            try:
-                backup_json_path = os.path.join(self.session_dir, f"automation_log_{timestamp}.json")
-                shutil.copy2(self.json_log_file, backup_json_path)
-                abs_backup_json_path = os.path.abspath(backup_json_path)
-                logger.info(f"Backed up JSON log file to: {abs_backup_json_path}")
-                print(f"===> Backed up JSON log to: {abs_backup_json_path}")
-            except Exception as e:
-                logger.warning(f"Failed to backup JSON log file: {str(e)}")
-                print(f"===> WARNING: Failed to backup JSON log: {str(e)}")
+        try:
+            backup_json_path = os.path.join(self.session_dir, f"automation_log_{timestamp}.json")
+            shutil.copy2(self.json_log_file, backup_json_path)
+            logger.info(f"Backed up JSON log file to: {backup_json_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to backup JSON log file: {str(e)}")
+            print(f"===> WARNING: Failed to backup JSON log: {str(e)}")
+        
+        # JSON Lines 로그 파일 백업
+        try:
+            backup_jsonl_path = os.path.join(self.session_dir, f"automation_log_{timestamp}.jsonl")
+            shutil.copy2(self.jsonl_log_file, backup_jsonl_path)
+            logger.info(f"Backed up JSON lines log file to: {backup_jsonl_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to backup JSON lines log file: {str(e)}")
     
     def _initialize_log_files(self) -> None:
         """
-        로그 파일을 초기화합니다. 기존 파일이 있다면 내용을 지우고 새로 시작합니다.
+        로그 파일을 초기화합니다. 텍스트/JSON Lines 로그는 __init__에서 열면서 이미 비워졌습니다.
         """
-        # 텍스트 로그 파일 초기화
+        # 세 로그의 시작 시각은 한 번만 구해서 함께 사용
+        started_at = datetime.now()
+        
+        # 텍스트 로그 파일 헤더 기록 (열어둔 핸들로 한 번에 기록)
         try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                start_time = datetime.now().isoformat()
-                f.write(f"=== Playwright Automation Log - Started at {start_time} ===\n")
-                f.write(f"로그 디렉토리: {self.session_dir}\n\n")
-            abs_log_file = os.path.abspath(self.log_file)
-            logger.info(f"Initialized text log file: {abs_log_file}")
-            print(f"===> Initialized new text log file at {start_time}")
+            start_time = started_at.isoformat()
+            self._log_fp.write(
+                f"=== Playwright Automation Log - Started at {start_time} ===\n"
+                f"로그 디렉토리: {self.session_dir}\n\n"
+            )
+            logger.info(f"Initialized text log file: {self.log_file}")
         except Exception as e:
             logger.error(f"Failed to initialize text log file: {str(e)}")
             print(f"===> ERROR: Failed to initialize text log file: {str(e)}")
@@ -147,25 +356,240 @@ class PlaywrightLogger:
         try:
             initial_data = {
                 "session_id": self.session_id,
-                "timestamp": datetime.now().isoformat(),
-                "actions": [],
+                "timestamp": started_at,
                 "formatted_actions": []
             }
-            with open(self.json_log_file, 'w', encoding='utf-8') as f:
-                json.dump(initial_data, f, ensure_ascii=False, indent=2)
-            abs_json_log_file = os.path.abspath(self.json_log_file)
-            logger.info(f"Initialized JSON log file: {abs_json_log_file}")
-            print(f"===> Initialized new JSON log file")
+            with open(self.json_log_file, 'wb') as f:
+                f.write(_dump_json(initial_data))
+            logger.info(f"Initialized JSON log file: {self.json_log_file}")
         except Exception as e:
             logger.error(f"Failed to initialize JSON log file: {str(e)}")
             print(f"===> ERROR: Failed to initialize JSON log file: {str(e)}")
+        
+        # JSON Lines 로그 첫 줄에 세션 헤더 기록 (이후 줄은 모두 액션 기록)
+        try:
+            self._json_fp.write(_dump_json_line({"session_id": self.session_id, "timestamp": started_at}))
+        except Exception as e:
+            logger.error(f"Failed to write JSON lines log header: {str(e)}")
+    
+    @staticmethod
+    def _truncate(text: Any, max_length: int) -> Any:
+        """
+        문자열이 max_length보다 길면 끝을 "..."로 바꿔 max_length 길이로 자릅니다. 문자열이 아니면 그대로 반환합니다.
+        
+        Args:
+            text: 자를 값
+            max_length: 최대 길이 ("..." 포함)
+        """
+        if type(text) is not str or len(text) <= max_length:
+            return text
+        return text[:max_length - 3] + "..."
+    
+    @staticmethod
+    def _truncate_result(result: str) -> str:
+        """
+        로그에 기록할 결과 문자열을 MAX_RESULT_LENGTH 길이로 자르고 중략 표시를 붙입니다.
+        
+        Args:
+            result: 액션 결과 문자열
+        """
+        if len(result) <= MAX_RESULT_LENGTH:
+            return result
+        return result[:MAX_RESULT_LENGTH] + "... (중략됨)"
     
-    async def store_element_info(self, element_index: int) -> Optional[Dict[str, Any]]:
+    def _submit_write(self, write, data: Union[str, bytes]) -> None:
+        """
+        파일 쓰기를 I/O 스레드에 넘기고 바로 반환합니다. 작업자가 하나라서 기록 순서는 유지됩니다.
+        
+        Args:
+            write: 호출할 쓰기 함수 (열어둔 파일 핸들의 write)
+            data: 기록할 데이터
+        """
+        if self._closed:
+            logger.warning("PlaywrightLogger is closed, dropping log write")
+            return
+        self._io_executor.submit(write, data).add_done_callback(_report_write_error)
+    
+    def write_log(self, text: str) -> None:
+        """
+        세션 동안 열려 있는 핸들로 텍스트 로그 파일에 기록합니다. (I/O 스레드에서 비동기로 기록)
+        
+        Args:
+            text: 기록할 문자열
+        """
+        self._submit_write(self._log_fp.write, text)
+    
+    def _append_json(self, record: Dict[str, Any], hold: bool = False) -> None:
+        """
+        액션 원본 기록을 JSON Lines 로그에 한 줄로 추가하고, 메모리에는 포맷팅된 기록만 보관합니다.
+        
+        Args:
+            record: 기록할 액션 정보
+            hold: True이면 바로 내보내지 않고 다음 기록과 함께 한 번에 내보냄 (pre-action 기록용)
+        """
+        # 타임스탬프는 기록 생성 시점에 넣으므로 _save_json에서 따로 채우지 않음
+        assert "timestamp" in record, "action record must carry a timestamp"
+        # 이후 record가 바뀌어도 기록 시점의 내용이 남도록 여기서 포맷팅/직렬화
+        entry = (self._format_action(record), _dump_json_line(record))
+        pending, self._pending_json = self._pending_json, None
+        if hold:
+            # 짝이 되는 post-action 기록 없이 남아 있던 기록은 먼저 내보냄
+            if pending is not None:
+                self._write_json_entries((pending,))
+            self._pending_json = entry
+            return
+        self._write_json_entries((pending, entry) if pending is not None else (entry,))
+    
+    def _write_json_entries(self, entries: Tuple[Tuple[Dict[str, Any], bytes], ...]) -> None:
+        """
+        포맷팅된 기록은 메모리에 보관하고, 직렬화된 줄들은 한 번의 쓰기로 JSON Lines 로그에 추가합니다.
+        
+        Args:
+            entries: (포맷팅된 기록, 직렬화된 줄) 목록
+        """
+        self._formatted_actions.extend(formatted for formatted, _ in entries)
+        self._json_dirty = True
+        self._submit_write(self._json_fp.write, b"".join(line for _, line in entries))
+    
+    def _release_pending_json(self) -> None:
+        """보류 중인 pre-action 기록이 있으면 내보냅니다. (finalize 전에 호출)"""
+        pending, self._pending_json = self._pending_json, None
+        if pending is not None:
+            self._write_json_entries((pending,))
+    
+    def _flush_files(self) -> None:
+        """I/O 스레드에서 실행: 버퍼에 남은 텍스트 로그와 JSON Lines 로그를 파일로 내보내기"""
+        if not self._log_fp.closed:
+            self._log_fp.flush()
+        if not self._json_fp.closed:
+            self._json_fp.flush()
+    
+    def _count_action_for_flush(self) -> None:
+        """액션 하나가 끝날 때마다 호출: flush_interval_actions개마다 버퍼 내보내기를 I/O 스레드에 예약"""
+        self._actions_since_flush += 1
+        interval = self.flush_interval_actions
+        if interval > 0 and self._actions_since_flush >= interval and not self._closed:
+            self._actions_since_flush = 0
+            self._io_executor.submit(self._flush_files).add_done_callback(_report_write_error)
+    
+    def _take_json_snapshot(self) -> Optional[int]:
+        """
+        finalize를 요청하는 스레드(이벤트 루프)에서 호출: 보류 중인 기록을 내보내고 저장할 액션 수를 정합니다.
+        dirty 플래그도 여기서 내리므로, I/O 스레드가 저장하는 동안 추가된 액션은 다음 finalize에서 저장됩니다.
+        
+        Returns:
+            저장할 formatted_actions 수, 새로 추가된 액션이 없으면 None
+        """
+        self._release_pending_json()
+        self._actions_since_flush = 0
+        if not self._json_dirty:
+            return None
+        self._json_dirty = False
+        return len(self._formatted_actions)
+    
+    def _finalize_files(self, json_count: Optional[int]) -> None:
+        """
+        I/O 스레드에서 실행: automation_log.json 생성, 로그 버퍼 내보내기 및 디스크 동기화
+        
+        Args:
+            json_count: _take_json_snapshot()이 정한 저장할 액션 수 (None이면 automation_log.json을 다시 쓰지 않음)
+        """
+        if json_count is not None:
+            self._save_json(json_count)
+        self._flush_files()
+        # 세션 마무리 시점에만 디스크까지 동기화 (액션마다 하는 flush는 OS 버퍼까지만)
+        for fp in (self._log_fp, self._json_fp):
+            if not fp.closed:
+                os.fsync(fp.fileno())
+    
+    def finalize(self) -> None:
+        """
+        지금까지의 액션으로 automation_log.json (formatted_actions)을 생성합니다.
+        액션마다 전체 파일을 다시 쓰지 않도록 세션 종료 시점에 한 번 호출합니다.
+        앞서 넘긴 기록이 모두 끝난 뒤 처리되며, 완료될 때까지 기다립니다.
+        """
+        if self._closed:
+            return
+        self._io_executor.submit(self._finalize_files, self._take_json_snapshot()).result()
+    
+    async def afinalize(self) -> None:
+        """
+        finalize()의 비동기 버전. 이벤트 루프를 막지 않고 I/O 스레드의 마무리 작업이 끝나기를 기다립니다.
+        """
+        if self._closed:
+            return
+        await asyncio.wrap_future(self._io_executor.submit(self._finalize_files, self._take_json_snapshot()))
+    
+    def close(self) -> None:
+        """
+        automation_log.json을 마무리하고 열어둔 로그 파일 핸들을 닫습니다.
+        """
+        if self._closed:
+            return
+        json_count = self._take_json_snapshot()
+        try:
+            self._io_executor.submit(self._finalize_files, json_count).result()
+        except RuntimeError:
+            # 인터프리터 종료 중(atexit)에는 I/O 스레드가 이미 남은 작업을 끝내고 새 작업을 받지 않으므로 직접 마무리
+            self._finalize_files(json_count)
+        self._shutdown_io()
+    
+    async def aclose(self) -> None:
+        """
+        close()의 비동기 버전. 남은 기록을 이벤트 루프를 막지 않고 내보낸 뒤 핸들을 닫습니다.
+        """
+        if self._closed:
+            return
+        await self.afinalize()
+        self._shutdown_io()
+    
+    async def __aenter__(self) -> "PlaywrightLogger":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    def _shutdown_io(self) -> None:
+        """I/O 스레드를 종료하고 열어둔 로그 파일 핸들을 닫습니다. (남은 작업이 없는 상태에서 호출)"""
+        self._closed = True
+        self._finalizer.detach()
+        _live_loggers.discard(self)
+        self._io_executor.shutdown(wait=True)
+        if not self._log_fp.closed:
+            self._log_fp.close()
+        if not self._json_fp.closed:
+            self._json_fp.close()
+    
+    def _print_console(self, lines: List[str]) -> None:
+        """
+        액션 하나의 콘솔 출력을 한 번의 print로 내보냅니다. verbose가 꺼져 있으면 출력하지 않습니다.
+        
+        Args:
+            lines: 출력할 줄 목록
+        """
+        if self.verbose and lines:
+            print("\n".join(lines))
+    
+    async def _get_current_url(self) -> Optional[str]:
+        """
+        현재 페이지 URL을 반환합니다. 브라우저 컨텍스트가 없거나 실패하면 None을 반환합니다.
+        """
+        if not self.browser_context:
+            return None
+        try:
+            page = await self.browser_context.get_current_page()
+            return page.url
+        except Exception as e:
+            logger.debug("Failed to get current URL: %s", e)
+            return None
+    
+    async def store_element_info(self, element_index: int, timestamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         특정 인덱스의 DOM 요소에 대한 상세 정보를 수집하고 저장합니다.
         
         Args:
             element_index: 요소의 인덱스
+            timestamp: 호출한 쪽에서 이미 구한 ISO 형식 타임스탬프 (없으면 새로 구함)
             
         Returns:
             요소 정보를 담은 딕셔너리 또는 None (요소를 찾지 못한 경우)
@@ -184,9 +608,15 @@ class PlaywrightLogger:
                 logger.warning(f"Element with index {element_index} not found in selector map")
                 return None
             
+            # 같은 액션 안에서 같은 상태의 요소를 다시 요청하면 이전 결과를 재사용
+            cached = self._elem_info_cache.get(element_index)
+            if cached is not None and cached[0] is state.selector_map:
+                return cached[1]
+            
             element_node = state.selector_map[element_index]
             
             # 요소 정보 수집
+            text_content = element_node.get_text_content()
             element_info = {
                 "index": element_index,
                 "tag_name": element_node.tag_name,
@@ -195,14 +625,16 @@ class PlaywrightLogger:
                 "is_interactive": element_node.is_interactive,
                 "is_top_element": element_node.is_top_element,
                 "attributes": element_node.attributes,
-                "text_content": element_node.get_text_content(),
-                "timestamp": datetime.now().isoformat()
+                "text_content": text_content,
+                "timestamp": timestamp or _now_iso()
             }
             
             # 중요 속성 추출
-            for attr in ['id', 'class', 'name', 'type', 'value', 'href', 'src', 'placeholder', 'aria-label', 'role', 'title', 'alt', 'data-testid']:
-                if attr in element_node.attributes:
-                    element_info[attr] = element_node.attributes[attr]
+            attributes = element_node.attributes
+            for attr in _IMPORTANT_ATTRS:
+                value = attributes.get(attr)
+                if value is not None:
+                    element_info[attr] = value
             
             # 요소의 CSS 선택자 생성 시도
             try:
@@ -210,37 +642,22 @@ class PlaywrightLogger:
                 if css_selector:
                     element_info["css_selector"] = css_selector
             except Exception as e:
-                logger.debug(f"Failed to generate CSS selector: {str(e)}")
+                logger.debug("Failed to generate CSS selector: %s", e)
             
-            # 요소의 텍스트 콘텐츠 추출
-            try:
-                element_info["inner_text"] = element_node.get_all_text()
-            except Exception as e:
-                logger.debug(f"Failed to get inner text: {str(e)}")
+            # get_all_text는 get_text_content와 같은 값을 돌려주므로 DOM을 다시 순회하지 않음
+            element_info["inner_text"] = text_content
             
             # 부모 요소 존재 여부 확인
-            try:
-                element_info["has_parent"] = element_node.parent is not None
-            except Exception as e:
-                logger.debug(f"Failed to check parent: {str(e)}")
+            element_info["has_parent"] = element_node.parent is not None
             
-            # 자식 요소 정보 추출
-            try:
-                child_count = 0
-                child_tags = []
-                
-                for child in element_node.children:
-                    # 안전하게 자식 요소가 DOMElementNode인지 확인
-                    if isinstance(child, DOMElementNode):
-                        child_count += 1
-                        child_tags.append(child.tag_name)
-                
-                if child_count > 0:
-                    element_info["children_count"] = child_count
-                    element_info["children_tags"] = child_tags
-            except Exception as e:
-                logger.debug(f"Failed to get children info: {str(e)}")
+            # 자식 요소 정보 추출 (텍스트 노드는 제외). input 등 자식이 없는 요소는 순회하지 않음
+            children = element_node.children
+            child_tags = [child.tag_name for child in children if isinstance(child, DOMElementNode)] if children else None
+            if child_tags:
+                element_info["children_count"] = len(child_tags)
+                element_info["children_tags"] = child_tags
             
+            self._elem_info_cache[element_index] = (state.selector_map, element_info)
             return element_info
             
         except Exception as e:
@@ -258,34 +675,50 @@ class PlaywrightLogger:
             CSS 선택자 문자열 또는 None
         """
         try:
-            # ID가 있으면 ID 선택자 사용
-            if 'id' in element_node.attributes and element_node.attributes['id']:
-                return f"#{element_node.attributes['id']}"
-            
-            # 클래스가 있으면 태그와 클래스 조합 사용
-            if 'class' in element_node.attributes and element_node.attributes['class']:
-                classes = element_node.attributes['class'].split()
-                if classes:
-                    return f"{element_node.tag_name}.{classes[0]}"
+            # 선택자를 결정하는 값이 같으면 이전에 만든 선택자를 재사용
+            attributes = element_node.attributes
+            key = (
+                element_node.tag_name,
+                attributes.get('id'),
+                attributes.get('class'),
+                tuple(map(attributes.get, _CSS_SELECTOR_ATTRS)),
+            )
+            if key in self._css_cache:
+                return self._css_cache[key]
             
-            # name 속성이 있으면 사용
-            if 'name' in element_node.attributes and element_node.attributes['name']:
-                return f"{element_node.tag_name}[name='{element_node.attributes['name']}']"
-            
-            # data-testid 속성이 있으면 사용
-            if 'data-testid' in element_node.attributes and element_node.attributes['data-testid']:
-                return f"{element_node.tag_name}[data-testid='{element_node.attributes['data-testid']}']"
-            
-            # aria-label 속성이 있으면 사용
-            if 'aria-label' in element_node.attributes and element_node.attributes['aria-label']:
-                return f"{element_node.tag_name}[aria-label='{element_node.attributes['aria-label']}']"
-            
-            # 기본적으로 XPath 반환
-            return None
+            selector = self._build_css_selector(*key)
+            if len(self._css_cache) >= _CSS_CACHE_SIZE:
+                # 가장 오래된 항목부터 제거
+                del self._css_cache[next(iter(self._css_cache))]
+            self._css_cache[key] = selector
+            return selector
         except Exception as e:
-            logger.debug(f"Error generating CSS selector: {str(e)}")
+            logger.debug("Error generating CSS selector: %s", e)
             return None
 
+    @staticmethod
+    def _build_css_selector(tag_name: str, element_id: Optional[str], class_name: Optional[str],
+                            attr_values: Tuple[Optional[str], ...]) -> Optional[str]:
+        """_generate_css_selector의 선택자 생성 규칙 (우선순위: id > class > _CSS_SELECTOR_ATTRS 순서)"""
+        # ID가 있으면 ID 선택자 사용
+        if element_id:
+            return f"#{element_id}"
+        
+        # 클래스가 있으면 태그와 클래스 조합 사용
+        if class_name:
+            # 첫 번째 클래스만 쓰므로 나머지는 나누지 않음
+            classes = class_name.split(maxsplit=1)
+            if classes:
+                return f"{tag_name}.{classes[0]}"
+        
+        # name, data-testid, aria-label 중 먼저 값이 있는 속성 사용
+        for attr, value in zip(_CSS_SELECTOR_ATTRS, attr_values):
+            if value:
+                return f"{tag_name}[{attr}='{value}']"
+        
+        # 기본적으로 XPath 반환
+        return None
+
     async def log_action_before_execute(self, 
                                       action_type: str, 
                                       element_index: Optional[int] = None,
@@ -307,117 +740,109 @@ class PlaywrightLogger:
         Returns:
             요소 정보 딕셔너리 (나중에 비교를 위해)
         """
-        timestamp = datetime.now().isoformat()
-        logger.debug(f"[log_action_before_execute] Action: {action_type}, Index: {element_index}")
+        timestamp = _now_iso()
+        logger.debug("[log_action_before_execute] Action: %s, Index: %s", action_type, element_index)
+        # 이전 액션에서 수집한 요소 정보는 재사용하지 않음
+        self._elem_info_cache.clear()
         
-        # 콘솔에 중요 정보 출력
-        print(f"\n===> PRE-ACTION: {action_type}")
+        # 콘솔에 중요 정보 출력 (모아서 한 번에 출력)
+        console = []
+        console.append(f"\n===> PRE-ACTION: {action_type}")
         if element_index is not None:
-            print(f"     Element Index: {element_index}")
+            console.append(f"     Element Index: {element_index}")
         if text:
-            print(f"     Text: {text}")
+            console.append(f"     Text: {text}")
         if url:
-            print(f"     URL: {url}")
+            console.append(f"     URL: {url}")
         
-        # 현재 페이지 URL 가져오기
-        current_url = None
-        if self.browser_context:
-            try:
-                page = await self.browser_context.get_current_page()
-                current_url = page.url
-                print(f"     Current URL: {current_url}")
-            except Exception as e:
-                logger.debug(f"Failed to get current URL: {str(e)}")
-        
-        # 실행 전 element 정보 수집
+        # 현재 페이지 URL과 실행 전 element 정보를 동시에 수집
         element_info = None
-        if element_index is not None:
-            try:
-                element_info = await self.store_element_info(element_index)
-                if element_info:
-                    print(f"     Element Tag: {element_info.get('tag_name', 'unknown')}")
-                    if 'text_content' in element_info and element_info['text_content']:
-                        text_preview = element_info['text_content']
-                        if len(text_preview) > 50:
-                            text_preview = text_preview[:47] + "..."
-                        print(f"     Content: {text_preview}")
-            except Exception as e:
-                logger.error(f"Error storing element info: {str(e)}")
-                print(f"     ERROR: Could not get element info: {str(e)}")
+        if element_index is not None and self.collect_element_info:
+            current_url, element_info = await asyncio.gather(
+                self._get_current_url(), self.store_element_info(element_index, timestamp), return_exceptions=True
+            )
+        else:
+            current_url = await self._get_current_url()
+        if current_url is not None:
+            console.append(f"     Current URL: {current_url}")
+        
+        if isinstance(element_info, Exception):
+            logger.error(f"Error storing element info: {str(element_info)}")
+            console.append(f"     ERROR: Could not get element info: {str(element_info)}")
+            element_info = None
+        elif element_info:
+            console.append(f"     Element Tag: {element_info.get('tag_name', 'unknown')}")
+            if 'text_content' in element_info and element_info['text_content']:
+                console.append(f"     Content: {self._truncate(element_info['text_content'], 50)}")
+        self._print_console(console)
         
         # 통합 로그 파일에 기록 - 예외 처리 추가
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n=== PRE-ACTION: {action_type} - {timestamp} ===\n")
-                if current_url:
-                    f.write(f"Current URL: {current_url}\n")
-                if element_index is not None:
-                    f.write(f"Element Index: {element_index}\n")
-                if selector:
-                    f.write(f"CSS Selector: {selector}\n")
-                if xpath:
-                    f.write(f"XPath: {xpath}\n")
-                if text:
-                    f.write(f"Text: {text}\n")
-                if url:
-                    f.write(f"URL: {url}\n")
-                
-                # 요소 정보가 있으면 상세 정보 기록 (한 번만 기록)
-                if element_info:
-                    f.write(f"\n=== ELEMENT DETAILS: {action_type} - {timestamp} ===\n")
-                    f.write(f"Element Index: {element_index}\n")
-                    f.write(f"Tag: {element_info.get('tag_name', 'unknown')}\n")
-                    
-                    # 텍스트 콘텐츠 (있는 경우)
-                    if "text_content" in element_info and element_info["text_content"]:
-                        text_content = element_info["text_content"]
-                        if len(text_content) > 200:
-                            text_content = text_content[:197] + "..."
-                        f.write(f"Text Content: {text_content}\n")
-                    
-                    # 가시성 및 상호작용 정보
-                    f.write(f"Is Visible: {element_info.get('is_visible', False)}\n")
-                    f.write(f"Is Enabled: {element_info.get('is_interactive', False)}\n")
-                    
-                    # 중요 속성 정보
-                    if "attributes" in element_info:
-                        f.write("Attributes:\n")
-                        important_attrs = ['id', 'class', 'name', 'type', 'value', 'href', 'src', 'aria-label', 'role', 'title']
-                        for attr in important_attrs:
-                            if attr in element_info["attributes"]:
-                                f.write(f"  {attr}: {element_info['attributes'][attr]}\n")
-                    
-                    # 위치 및 크기 정보 (있는 경우)
-                    if "position" in element_info and "size" in element_info:
-                        pos = element_info["position"]
-                        size = element_info["size"]
-                        f.write(f"Position: x={pos['x']}, y={pos['y']}\n")
-                        f.write(f"Size: width={size['width']}, height={size['height']}\n")
-                    
-                    # XPath 및 CSS 선택자
-                    f.write(f"XPath: {element_info.get('xpath', '')}\n")
-                    if "css_selector" in element_info:
-                        f.write(f"CSS Selector: {element_info['css_selector']}\n")
-                    
-                    # 부모 요소 정보
-                    if "has_parent" in element_info and element_info["has_parent"]:
-                        f.write("Parent Element:\n")
-                        f.write(f"  tag_name: {element_info.get('parent_tag_name', 'unknown')}\n")
-                        f.write(f"  id: {element_info.get('parent_id', 'None')}\n")
-                        f.write(f"  class_name: {element_info.get('parent_class', 'None')}\n")
-                        f.write(f"  has_parent: {element_info['has_parent']}\n")
-                    
-                    # 자식 요소 정보
-                    if "children_count" in element_info:
-                        f.write(f"Children Count: {element_info['children_count']}\n")
-                        if "children_tags" in element_info:
-                            f.write(f"Children Tags: {', '.join(element_info['children_tags'])}\n")
-                    
-                    f.write("-" * 80 + "\n")
-                else:
-                    f.write("-" * 80 + "\n")
+            parts = []
+            parts.append(f"\n=== PRE-ACTION: {action_type} - {timestamp} ===\n")
+            if current_url:
+                parts.append(f"Current URL: {current_url}\n")
+            if element_index is not None:
+                parts.append(f"Element Index: {element_index}\n")
+            if selector:
+                parts.append(f"CSS Selector: {selector}\n")
+            if xpath:
+                parts.append(f"XPath: {xpath}\n")
+            if text:
+                parts.append(f"Text: {text}\n")
+            if url:
+                parts.append(f"URL: {url}\n")
             
-            logger.debug(f"Successfully wrote pre-action log for {action_type}")
+            # 요소 정보가 있으면 상세 정보 기록 (한 번만 기록)
+            if element_info:
+                parts.append(f"\n=== ELEMENT DETAILS: {action_type} - {timestamp} ===\n")
+                parts.append(f"Element Index: {element_index}\n")
+                parts.append(f"Tag: {element_info.get('tag_name', 'unknown')}\n")
+                
+                # 텍스트 콘텐츠 (있는 경우)
+                if "text_content" in element_info and element_info["text_content"]:
+                    parts.append(f"Text Content: {self._truncate(element_info['text_content'], 200)}\n")
+                
+                # 가시성 및 상호작용 정보
+                parts.append(f"Is Visible: {element_info.get('is_visible', False)}\n")
+                parts.append(f"Is Enabled: {element_info.get('is_interactive', False)}\n")
+                
+                # 중요 속성 정보
+                if "attributes" in element_info:
+                    parts.append("Attributes:\n")
+                    attributes = element_info["attributes"]
+                    parts.extend(f"  {attr}: {attributes[attr]}\n" for attr in _LOG_TEXT_ATTRS if attr in attributes)
+                
+                # 위치 및 크기 정보 (있는 경우)
+                if "position" in element_info and "size" in element_info:
+                    pos = element_info["position"]
+                    size = element_info["size"]
+                    parts.append(f"Position: x={pos['x']}, y={pos['y']}\n")
+                    parts.append(f"Size: width={size['width']}, height={size['height']}\n")
+                
+                # XPath 및 CSS 선택자
+                parts.append(f"XPath: {element_info.get('xpath', '')}\n")
+                if "css_selector" in element_info:
+                    parts.append(f"CSS Selector: {element_info['css_selector']}\n")
+                
+                # 부모 요소 정보
+                if "has_parent" in element_info and element_info["has_parent"]:
+                    parts.append("Parent Element:\n")
+                    parts.append(f"  tag_name: {element_info.get('parent_tag_name', 'unknown')}\n")
+                    parts.append(f"  id: {element_info.get('parent_id', 'None')}\n")
+                    parts.append(f"  class_name: {element_info.get('parent_class', 'None')}\n")
+                    parts.append(f"  has_parent: {element_info['has_parent']}\n")
+                
+                # 자식 요소 정보
+                if "children_count" in element_info:
+                    parts.append(f"Children Count: {element_info['children_count']}\n")
+                    if "children_tags" in element_info:
+                        parts.append(f"Children Tags: {', '.join(element_info['children_tags'])}\n")
+                
+                parts.append("-" * 80 + "\n")
+            else:
+                parts.append("-" * 80 + "\n")
+            self.write_log("".join(parts))
         except Exception as e:
             logger.error(f"Error writing pre-action log: {str(e)}")
             print(f"     ERROR: Failed to write to log file: {str(e)}")
@@ -436,11 +861,9 @@ class PlaywrightLogger:
             "element_info": element_info
         }
         
-        # JSON 로그에 pre-action 정보 추가
+        # JSON 로그에 pre-action 정보 추가 (post-action 기록과 함께 한 번에 내보냄)
         try:
-            self.actions.append(pre_action_info)
-            self._save_json()
-            logger.debug(f"Successfully saved pre-action JSON for {action_type}")
+            self._append_json(pre_action_info, hold=True)
         except Exception as e:
             logger.error(f"Error saving pre-action JSON: {str(e)}")
             print(f"     ERROR: Failed to save JSON log: {str(e)}")
@@ -473,48 +896,50 @@ class PlaywrightLogger:
             error: 오류 메시지 (있는 경우)
             additional_data: 추가 데이터 (있는 경우)
         """
-        timestamp = datetime.now().isoformat()
-        logger.debug(f"[log_action_after_execute] Action: {action_type}, Index: {element_index}")
+        timestamp = _now_iso()
+        logger.debug("[log_action_after_execute] Action: %s, Index: %s", action_type, element_index)
         
-        # 콘솔에 중요 정보 출력
+        # 콘솔에 중요 정보 출력 (모아서 한 번에 출력)
+        console = []
         status = "ERROR" if error else "SUCCESS"
-        print(f"\n===> POST-ACTION: {action_type} - {status}")
+        console.append(f"\n===> POST-ACTION: {action_type} - {status}")
         if element_index is not None:
             tag = pre_action_element_info.get('tag_name', '') if pre_action_element_info else ''
-            print(f"     Element: {tag} (index: {element_index})")
+            console.append(f"     Element: {tag} (index: {element_index})")
         if text:
-            print(f"     Text: {text}")
+            console.append(f"     Text: {text}")
+        # 텍스트 로그 두 블록에서 함께 쓰도록 결과는 한 번만 잘라 둠
+        logged_result = self._truncate_result(result) if result else result
         if result:
             # 결과가 너무 길면 잘라서 출력
             if len(result) > MAX_RESULT_LENGTH:
-                truncated_result = result[:MAX_RESULT_LENGTH] + "... (중략됨, 전체 길이: " + str(len(result)) + "자)"
-                print(f"     Result: {truncated_result}")
+                console.append(f"     Result: {result[:MAX_RESULT_LENGTH]}... (중략됨, 전체 길이: {len(result)}자)")
             else:
-                print(f"     Result: {result}")
+                console.append(f"     Result: {result}")
         if error:
-            print(f"     Error: {error}")
-        
-        # 현재 페이지 URL 가져오기
-        current_url = None
-        if self.browser_context:
-            try:
-                page = await self.browser_context.get_current_page()
-                current_url = page.url
-                print(f"     Current URL: {current_url}")
-            except Exception as e:
-                logger.debug(f"Failed to get current URL: {str(e)}")
+            console.append(f"     Error: {error}")
         
-        # 액션 실행 후 요소 정보 수집 (가능한 경우)
+        # 현재 페이지 URL과 액션 실행 후 요소 정보를 동시에 수집 (가능한 경우)
         post_action_element_info = None
-        if element_index is not None:
-            try:
-                post_action_element_info = await self.store_element_info(element_index)
-            except Exception as e:
-                logger.debug(f"Failed to get post-action element info: {str(e)}")
+        if element_index is not None and self.collect_element_info and action_type in _ELEMENT_MUTATING_ACTIONS:
+            current_url, post_action_element_info = await asyncio.gather(
+                self._get_current_url(), self.store_element_info(element_index, timestamp), return_exceptions=True
+            )
+            if isinstance(post_action_element_info, Exception):
+                logger.debug("Failed to get post-action element info: %s", post_action_element_info)
+                post_action_element_info = None
+        else:
+            current_url = await self._get_current_url()
+            if element_index is not None:
+                # 요소를 바꾸지 않는 액션은 실행 전 정보를 그대로 사용
+                post_action_element_info = pre_action_element_info
+        if current_url is not None:
+            console.append(f"     Current URL: {current_url}")
         
-        # 요소 변경 사항 확인
+        # 요소 변경 사항 확인 (텍스트 로그와 JSON 로그가 함께 사용)
         changes = {}
-        if pre_action_element_info and post_action_element_info:
+        # 실행 전 정보를 그대로 재사용한 경우(같은 객체)에는 비교할 필요가 없음
+        if pre_action_element_info and post_action_element_info and pre_action_element_info is not post_action_element_info:
             # 텍스트 내용 변경 확인
             if pre_action_element_info.get('text_content') != post_action_element_info.get('text_content'):
                 changes['text_content'] = {
@@ -540,137 +965,115 @@ class PlaywrightLogger:
             pre_attrs = pre_action_element_info.get('attributes', {})
             post_attrs = post_action_element_info.get('attributes', {})
             
-            for key in set(list(pre_attrs.keys()) + list(post_attrs.keys())):
-                if pre_attrs.get(key) != post_attrs.get(key):
-                    if 'attributes' not in changes:
-                        changes['attributes'] = {}
-                    changes['attributes'][key] = {
-                        'before': pre_attrs.get(key),
-                        'after': post_attrs.get(key)
-                    }
+            # 같은 DOM 노드의 속성 딕셔너리를 공유하면 달라진 속성이 없음
+            attr_changes = {} if pre_attrs is post_attrs else {
+                key: {'before': pre_attrs.get(key), 'after': post_attrs.get(key)}
+                for key in pre_attrs.keys() | post_attrs.keys()
+                if pre_attrs.get(key) != post_attrs.get(key)
+            }
+            if attr_changes:
+                changes['attributes'] = attr_changes
         
         # 변경 사항이 있으면 콘솔에 출력
         if changes:
-            print(f"     Changes detected in element properties")
+            console.append(f"     Changes detected in element properties")
             for key, value in changes.items():
                 if key == 'attributes':
                     for attr_key, attr_value in value.items():
-                        print(f"       {attr_key}: {attr_value['before']} -> {attr_value['after']}")
+                        console.append(f"       {attr_key}: {attr_value['before']} -> {attr_value['after']}")
                 else:
-                    print(f"       {key}: {value['before']} -> {value['after']}")
+                    console.append(f"       {key}: {value['before']} -> {value['after']}")
+        self._print_console(console)
+        
+        # 상세 블록과 요약 블록을 모아 한 번에 기록
+        log_parts = []
         
         # 통합 로그 파일에 기록 (POST-ACTION) - 예외 처리 추가
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n=== POST-ACTION: {action_type} - {timestamp} ===\n")
-                if current_url:
-                    f.write(f"Current URL: {current_url}\n")
-                if element_index is not None:
-                    f.write(f"Element Index: {element_index}\n")
-                if selector:
-                    f.write(f"CSS Selector: {selector}\n")
-                if xpath:
-                    f.write(f"XPath: {xpath}\n")
-                if text:
-                    f.write(f"Text: {text}\n")
-                if url:
-                    f.write(f"URL: {url}\n")
-                
-                # 결과 또는 오류 기록
-                if result:
-                    # 결과가 너무 길면 잘라서 기록
-                    if len(result) > MAX_RESULT_LENGTH:
-                        truncated_result = result[:MAX_RESULT_LENGTH] + "... (중략됨)"
-                        f.write(f"\nResult: {truncated_result}\n")
+            parts = []
+            parts.append(f"\n=== POST-ACTION: {action_type} - {timestamp} ===\n")
+            if current_url:
+                parts.append(f"Current URL: {current_url}\n")
+            if element_index is not None:
+                parts.append(f"Element Index: {element_index}\n")
+            if selector:
+                parts.append(f"CSS Selector: {selector}\n")
+            if xpath:
+                parts.append(f"XPath: {xpath}\n")
+            if text:
+                parts.append(f"Text: {text}\n")
+            if url:
+                parts.append(f"URL: {url}\n")
+            
+            # 결과 또는 오류 기록
+            if result:
+                # 결과가 너무 길면 잘라서 기록
+                parts.append(f"\nResult: {logged_result}\n")
+            if error:
+                parts.append(f"\nError: {error}\n")
+            
+            # 추가 데이터 기록 (간소화)
+            if additional_data:
+                parts.append("\n--- Additional Data ---\n")
+                parts.extend(
+                    f"{key}: {value}\n"
+                    for key, value in additional_data.items()
+                    if key != "element_details" and key != "post_action_element_details"
+                )
+            
+            # 요소 변경 사항 기록 (중요한 변경 사항만)
+            if changes:
+                parts.append("\n--- Element Changes ---\n")
+                for key, value in changes.items():
+                    if key == 'attributes':
+                        parts.append("Attributes Changes:\n")
+                        parts.extend(
+                            f"  {attr_key}: {attr_value['before']} -> {attr_value['after']}\n"
+                            for attr_key, attr_value in value.items()
+                        )
                     else:
-                        f.write(f"\nResult: {result}\n")
-                if error:
-                    f.write(f"\nError: {error}\n")
-                
-                # 추가 데이터 기록 (간소화)
-                if additional_data:
-                    f.write("\n--- Additional Data ---\n")
-                    for key, value in additional_data.items():
-                        if key != "element_details" and key != "post_action_element_details":
-                            f.write(f"{key}: {value}\n")
-                
-                # 요소 변경 사항 기록 (중요한 변경 사항만)
-                if changes:
-                    f.write("\n--- Element Changes ---\n")
-                    for key, value in changes.items():
-                        if key == 'attributes':
-                            f.write("Attributes Changes:\n")
-                            for attr_key, attr_value in value.items():
-                                f.write(f"  {attr_key}: {attr_value['before']} -> {attr_value['after']}\n")
-                        else:
-                            f.write(f"{key}: {value['before']} -> {value['after']}\n")
-                
-                f.write("-" * 80 + "\n")
+                        parts.append(f"{key}: {value['before']} -> {value['after']}\n")
             
-            logger.debug(f"Successfully wrote post-action detail log for {action_type}")
+            parts.append("-" * 80 + "\n")
+            log_parts.extend(parts)
         except Exception as e:
             logger.error(f"Error writing post-action detail log: {str(e)}")
             print(f"     ERROR: Failed to write post-action log: {str(e)}")
         
         # 액션 실행 결과를 간결하게 로그 파일에 기록 - 예외 처리 추가
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                status = "ERROR" if error else "SUCCESS"
-                f.write(f"{timestamp} - {action_type} - {status}\n")
-                if element_index is not None:
-                    tag = pre_action_element_info.get('tag_name', '') if pre_action_element_info else ''
-                    f.write(f"  Element: {tag} (index: {element_index})\n")
-                if text:
-                    f.write(f"  Text: {text}\n")
-                if url:
-                    f.write(f"  URL: {url}\n")
-                if current_url:
-                    f.write(f"  Current URL: {current_url}\n")
-                if result:
-                    # 결과가 너무 길면 잘라서 기록
-                    if len(result) > MAX_RESULT_LENGTH:
-                        truncated_result = result[:MAX_RESULT_LENGTH] + "... (중략됨)"
-                        f.write(f"  Result: {truncated_result}\n")
-                    else:
-                        f.write(f"  Result: {result}\n")
-                if error:
-                    f.write(f"  Error: {error}\n")
-                
-                # 변경 사항이 있으면 간략하게 기록
-                if changes:
-                    f.write("  Changes detected in element properties\n")
-                
-                f.write("\n")
+            parts = []
+            status = "ERROR" if error else "SUCCESS"
+            parts.append(f"{timestamp} - {action_type} - {status}\n")
+            if element_index is not None:
+                tag = pre_action_element_info.get('tag_name', '') if pre_action_element_info else ''
+                parts.append(f"  Element: {tag} (index: {element_index})\n")
+            if text:
+                parts.append(f"  Text: {text}\n")
+            if url:
+                parts.append(f"  URL: {url}\n")
+            if current_url:
+                parts.append(f"  Current URL: {current_url}\n")
+            if result:
+                # 결과가 너무 길면 잘라서 기록
+                parts.append(f"  Result: {logged_result}\n")
+            if error:
+                parts.append(f"  Error: {error}\n")
             
-            logger.debug(f"Successfully wrote post-action summary log for {action_type}")
+            # 변경 사항이 있으면 간략하게 기록
+            if changes:
+                parts.append("  Changes detected in element properties\n")
+            
+            parts.append("\n")
+            log_parts.extend(parts)
         except Exception as e:
             logger.error(f"Error writing post-action summary log: {str(e)}")
             print(f"     ERROR: Failed to write post-action summary: {str(e)}")
         
-        # 속성 정보 정리 및 보강
-        formatted_attributes = {}
-        if pre_action_element_info:
-            # 중요 속성 먼저 정렬
-            important_attrs = ['id', 'class', 'name', 'type', 'value', 'href', 'src', 'tag_name', 'text_content']
-            for attr in important_attrs:
-                if attr in pre_action_element_info:
-                    formatted_attributes[attr] = pre_action_element_info[attr]
-            
-            # 나머지 속성 추가
-            for key, value in pre_action_element_info.items():
-                if key not in formatted_attributes and key not in ['index', 'timestamp', 'attributes']:
-                    formatted_attributes[key] = value
-        
-        # 변경 사항 감지 (액션 전후 요소 비교)
-        changes = {}
-        if pre_action_element_info and post_action_element_info:
-            for key in pre_action_element_info:
-                if key in post_action_element_info and pre_action_element_info[key] != post_action_element_info[key]:
-                    changes[key] = {
-                        "before": pre_action_element_info[key],
-                        "after": post_action_element_info[key]
-                    }
+        if log_parts:
+            self.write_log("".join(log_parts))
         
+        # 요소 속성은 바로 앞의 pre-action 기록(element_info)에 있으므로 여기서 다시 만들지 않음
         action_data = {
             "timestamp": timestamp,
             "phase": "post_action",
@@ -681,7 +1084,6 @@ class PlaywrightLogger:
             "text": text,
             "url": url,
             "current_url": current_url,
-            "attributes": formatted_attributes,
             "result": result,
             "error": error,
             "changes": changes,
@@ -690,132 +1092,138 @@ class PlaywrightLogger:
         
         # JSON 로그에 post-action 정보 추가 - 예외 처리 추가
         try:
-            self.actions.append(action_data)
-            self._save_json()
-            logger.debug(f"Successfully saved post-action JSON for {action_type}")
+            self._append_json(action_data)
         except Exception as e:
             logger.error(f"Error saving post-action JSON: {str(e)}")
             print(f"     ERROR: Failed to save post-action JSON: {str(e)}")
         
+        self._count_action_for_flush()
         return action_data
     
-    def _save_json(self):
-        """JSON 파일에 액션 로그 저장 - 예외 처리 추가"""
+    def _format_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        액션 기록 하나를 읽기 쉬운 형식(formatted_actions 항목)으로 변환합니다.
+        
+        Args:
+            action: _append_json에 넘어온 액션 원본 기록
+            
+        Returns:
+            포맷팅된 액션 딕셔너리
+        """
+        # 요소 정보 추가
+        info = {}
+        if action.get("element_index") is not None:
+            info["index"] = action["element_index"]
+        info.update({key: action[key] for key in ("selector", "xpath") if action.get(key)})
+        
+        # 요소 상세 정보 추가
+        element_info = action.get("element_info")
+        if element_info:
+            # 기본 요소 정보
+            info["tag_name"] = element_info.get("tag_name", "")
+            info["is_visible"] = element_info.get("is_visible", False)
+            info["is_interactive"] = element_info.get("is_interactive", False)
+            
+            # CSS 선택자 정보
+            if "css_selector" in element_info:
+                info["css_selector"] = element_info["css_selector"]
+            
+            # 중요 속성 정보
+            attributes = {attr: element_info[attr] for attr in _IMPORTANT_ATTRS if attr in element_info}
+            if attributes:
+                info["attributes"] = attributes
+            
+            # 텍스트 콘텐츠, 부모/자식 요소 정보
+            info.update({key: element_info[key] for key in _FORMATTED_ELEMENT_KEYS if key in element_info})
+        
+        formatted_action = {
+            "timestamp": action.get("timestamp", ""),
+            "action_type": action.get("action_type", ""),
+            "phase": action.get("phase", ""),
+            "element_info": info
+        }
+        
+        # 텍스트 및 URL 정보 추가
+        formatted_action.update({key: action[key] for key in ("text", "url", "current_url") if action.get(key)})
+        
+        # 결과 정보 추가
+        result = action.get("result")
+        if result:
+            # 포맷팅된 결과에는 길이 제한 적용
+            formatted_action["result"] = self._truncate_result(result)
+            if len(result) > MAX_RESULT_LENGTH:
+                formatted_action["result_truncated"] = True
+                formatted_action["result_full_length"] = len(result)
+        
+        # 오류, 변경 사항, 추가 데이터 정보 추가
+        formatted_action.update({key: action[key] for key in ("error", "changes", "additional_data") if action.get(key)})
+        
+        return formatted_action
+    
+    def _save_json(self, count: int):
+        """
+        JSON 파일에 액션 로그 저장 - 예외 처리 추가
+        
+        Args:
+            count: 저장할 formatted_actions 수 (그 뒤에 추가된 액션은 다음 저장 때 기록)
+        """
         try:
-            # 각 액션에 타임스탬프 추가
-            for action in self.actions:
-                if "timestamp" not in action:
-                    action["timestamp"] = datetime.now().isoformat()
-            
-            # 액션 데이터를 더 읽기 쉬운 형식으로 변환
-            formatted_actions = []
-            for action in self.actions:
-                formatted_action = {
-                    "timestamp": action.get("timestamp", ""),
-                    "action_type": action.get("action_type", ""),
-                    "phase": action.get("phase", ""),
-                    "element_info": {}
+            # I/O 스레드에서 실행되는 동안에도 액션이 추가될 수 있으므로 정해진 count까지만 사용
+            actions = self._formatted_actions[:count]
+            # 이미 저장한 액션이 있으면 새 액션만 배열 끝에 덧붙임 (전체를 다시 직렬화하지 않음)
+            new_actions = actions[self._json_saved_count:]
+            if not (self._json_saved_count and self._splice_json_actions(new_actions)):
+                # 포맷팅된 액션 데이터 저장 (원본 액션 데이터는 automation_log.jsonl에 기록됨)
+                # 앞부분(session_id, timestamp)만 먼저 직렬화하고, 액션은 하나씩 직렬화해 이어 씀
+                # (문서 전체를 한 번에 bytes로 만들지 않아 액션 수에 비례하는 메모리 사용이 없음)
+                output_data = {
+                    "session_id": self.session_id,
+                    "timestamp": datetime.now(),
+                    "formatted_actions": [None] if actions else []
                 }
                 
-                # 요소 정보 추가
-                if "element_index" in action and action["element_index"] is not None:
-                    formatted_action["element_info"]["index"] = action["element_index"]
-                
-                if "selector" in action and action["selector"]:
-                    formatted_action["element_info"]["selector"] = action["selector"]
-                
-                if "xpath" in action and action["xpath"]:
-                    formatted_action["element_info"]["xpath"] = action["xpath"]
-                
-                # 요소 상세 정보 추가
-                if "element_info" in action and action["element_info"]:
-                    element_info = action["element_info"]
-                    
-                    # 기본 요소 정보
-                    formatted_action["element_info"]["tag_name"] = element_info.get("tag_name", "")
-                    formatted_action["element_info"]["is_visible"] = element_info.get("is_visible", False)
-                    formatted_action["element_info"]["is_interactive"] = element_info.get("is_interactive", False)
-                    
-                    # CSS 선택자 정보
-                    if "css_selector" in element_info:
-                        formatted_action["element_info"]["css_selector"] = element_info["css_selector"]
-                    
-                    # 중요 속성 정보
-                    attributes = {}
-                    for attr in ['id', 'class', 'name', 'type', 'value', 'href', 'src', 'placeholder', 'aria-label', 'role', 'title', 'alt', 'data-testid']:
-                        if attr in element_info:
-                            attributes[attr] = element_info[attr]
-                    
-                    if attributes:
-                        formatted_action["element_info"]["attributes"] = attributes
-                    
-                    # 텍스트 콘텐츠
-                    if "text_content" in element_info:
-                        formatted_action["element_info"]["text_content"] = element_info["text_content"]
-                    
-                    if "inner_text" in element_info:
-                        formatted_action["element_info"]["inner_text"] = element_info["inner_text"]
-                    
-                    # 부모 요소 정보
-                    if "has_parent" in element_info:
-                        formatted_action["element_info"]["has_parent"] = element_info["has_parent"]
-                    
-                    # 자식 요소 정보
-                    if "children_count" in element_info:
-                        formatted_action["element_info"]["children_count"] = element_info["children_count"]
-                        if "children_tags" in element_info:
-                            formatted_action["element_info"]["children_tags"] = element_info["children_tags"]
-                
-                # 텍스트 및 URL 정보 추가
-                if "text" in action and action["text"]:
-                    formatted_action["text"] = action["text"]
-                
-                if "url" in action and action["url"]:
-                    formatted_action["url"] = action["url"]
-                
-                if "current_url" in action and action["current_url"]:
-                    formatted_action["current_url"] = action["current_url"]
-                
-                # 결과 및 오류 정보 추가
-                if "result" in action and action["result"]:
-                    # 포맷팅된 결과에는 길이 제한 적용
-                    result = action["result"]
-                    if len(result) > MAX_RESULT_LENGTH:
-                        formatted_action["result"] = result[:MAX_RESULT_LENGTH] + "... (중략됨)"
-                        formatted_action["result_truncated"] = True
-                        formatted_action["result_full_length"] = len(result)
+                with open(self.json_log_file, 'wb') as f:
+                    if not actions:
+                        f.write(_dump_json(output_data))
                     else:
-                        formatted_action["result"] = result
-                
-                if "error" in action and action["error"]:
-                    formatted_action["error"] = action["error"]
-                
-                # 변경 사항 정보 추가
-                if "changes" in action and action["changes"]:
-                    formatted_action["changes"] = action["changes"]
-                
-                # 추가 데이터 정보 추가
-                if "additional_data" in action and action["additional_data"]:
-                    formatted_action["additional_data"] = action["additional_data"]
-                
-                formatted_actions.append(formatted_action)
+                        f.write(_dump_json(output_data)[:-len(_JSON_ACTIONS_PLACEHOLDER + _JSON_ACTIONS_TAIL)])
+                        for i, action in enumerate(actions):
+                            f.write((b",\n" if i else b"") + _dump_json_action(action))
+                        f.write(_JSON_ACTIONS_TAIL)
+            self._json_saved_count = count
             
-            # 원본 액션 데이터와 포맷팅된 액션 데이터 모두 저장
-            output_data = {
-                "session_id": self.session_id,
-                "timestamp": datetime.now().isoformat(),
-                "actions": self.actions,
-                "formatted_actions": formatted_actions
-            }
-            
-            with open(self.json_log_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
-            
-            logger.debug(f"Successfully saved JSON log with {len(self.actions)} actions")
+            logger.debug("Successfully saved JSON log with %d actions", count)
         except Exception as e:
             logger.error(f"Error saving JSON log: {str(e)}")
             print(f"     ERROR: Failed to save JSON log: {str(e)}")
 
+    def _splice_json_actions(self, new_actions: List[Dict[str, Any]]) -> bool:
+        """
+        automation_log.json의 formatted_actions 배열 끝에 새 액션들을 덧붙입니다.
+        
+        Args:
+            new_actions: 덧붙일 포맷팅된 액션 목록
+            
+        Returns:
+            덧붙였으면 True, 파일 끝이 예상한 형태가 아니어서 전체를 다시 써야 하면 False
+        """
+        if not new_actions:
+            return True
+        try:
+            with open(self.json_log_file, 'r+b') as f:
+                tail_offset = f.seek(0, os.SEEK_END) - len(_JSON_ACTIONS_TAIL)
+                if tail_offset < 0:
+                    return False
+                f.seek(tail_offset)
+                if f.read(len(_JSON_ACTIONS_TAIL)) != _JSON_ACTIONS_TAIL:
+                    return False
+                body = b",\n".join(_dump_json_action(action) for action in new_actions)
+                f.seek(tail_offset)
+                f.write(b",\n" + body + _JSON_ACTIONS_TAIL)
+            return True
+        except FileNotFoundError:
+            return False
+
     def generate_playwright_code(self, output_file: Optional[str] = None) -> str:
         """
         로그 파일 경로 반환 (JavaScript 코드 생성 기능은 삭제)
@@ -826,76 +1234,33 @@ class PlaywrightLogger:
         Returns:
             로그 파일 경로
         """
+        # 반환하는 JSON 파일이 최신 상태가 되도록 마무리
+        self.finalize()
         return f"로그 파일: {self.log_file}, JSON 파일: {self.json_log_file}"
 
-    async def _get_basic_attributes(self, element_handle) -> Dict[str, Any]:
-        """기본 element 속성 수집"""
-        attrs = {}
-        try:
-            attrs['tag'] = await element_handle.evaluate("el => el.tagName.toLowerCase()")
-            attrs['text'] = await element_handle.text_content()
-            
-            # 기본 속성들 수집
-            for attr in ['id', 'class', 'name', 'href', 'value']:
-                val = await element_handle.get_attribute(attr)
-                if val:
-                    attrs[attr] = val
-        except Exception as e:
-            logger.error(f"기본 속성 수집 중 에러: {e}")
-        return attrs
-
-    async def _get_element_geometry(self, element_handle) -> Dict[str, Any]:
-        """element의 위치와 크기 정보 수집"""
-        geometry = {}
-        try:
-            bbox = await element_handle.bounding_box()
-            if bbox:
-                geometry['position'] = {'x': bbox['x'], 'y': bbox['y']}
-                geometry['size'] = {'width': bbox['width'], 'height': bbox['height']}
-        except Exception as e:
-            logger.error(f"위치 정보 수집 중 에러: {e}")
-        return geometry
-
-    async def _get_visibility_info(self, element_handle) -> Dict[str, Any]:
-        """element의 가시성 정보 수집"""
-        visibility = {}
-        try:
-            visibility['visible'] = await element_handle.is_visible()
-            visibility['enabled'] = await element_handle.is_enabled()
-        except Exception as e:
-            logger.error(f"가시성 정보 수집 중 에러: {e}")
-        return visibility
-
-    async def _collect_element_details(self, element_handle) -> Dict[str, Any]:
-        """element의 상세 정보 수집"""
-        details = {}
-        try:
-            details.update(await self._get_basic_attributes(element_handle))
-            details.update(await self._get_element_geometry(element_handle))
-            details.update(await self._get_visibility_info(element_handle))
-        except Exception as e:
-            logger.error(f"Element 정보 수집 중 에러: {e}")
-        return details
-
 
 # 싱글톤 인스턴스
 _instance = None
 
-def get_playwright_logger(log_dir: Optional[str] = None, session_id: Optional[str] = None) -> PlaywrightLogger:
+def get_playwright_logger(log_dir: Optional[str] = None, session_id: Optional[str] = None, reset: bool = False) -> PlaywrightLogger:
     """
     PlaywrightLogger의 싱글톤 인스턴스 반환
     
     Args:
         log_dir: 로그 디렉토리 경로
         session_id: 사용하지 않음 (호환성을 위해 유지)
+        reset: True이면 기존 인스턴스를 닫고 새 세션으로 새 인스턴스 생성
         
     Returns:
         PlaywrightLogger 인스턴스
     """
     global _instance
     
-    # log_dir이 제공되었거나 인스턴스가 없으면 새 인스턴스 생성
-    if _instance is None or (log_dir is not None and log_dir != _instance.log_dir):
+    # reset이거나 다른 log_dir이 제공되었거나 인스턴스가 없으면 새 인스턴스 생성
+    if reset or _instance is None or (log_dir is not None and log_dir != _instance.log_dir):
+        # 교체되는 인스턴스는 남은 기록을 내보내고 파일 핸들을 닫음
+        if _instance is not None:
+            _instance.close()
         _instance = PlaywrightLogger(log_dir)
         
     return _instance 
\ No newline at end of file
@@ -31,10 +31,6 @@ LOG_DIR = os.environ.get('PLAYWRIGHT_LOG_DIR',
 if LOG_DIR.startswith('./'):
     LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', LOG_DIR[2:]))
 
-# 싱글톤 인스턴스 초기화를 위해 모듈 변수 직접 접근
-import browser_use.playwright_logger
-browser_use.playwright_logger._instance = None
-
 async def main():
     # 로그 디렉토리 출력
     print(f"로그 디렉토리: {LOG_DIR}")
@@ -43,7 +39,7 @@ async def main():
     os.makedirs(LOG_DIR, exist_ok=True)
     
     # 로거 초기화 (로그 디렉토리 지정)
-    logger = get_playwright_logger(log_dir=LOG_DIR)
+    logger = get_playwright_logger(log_dir=LOG_DIR, reset=True)
     
     # 브라우저 설정
     browser = Browser()
@@ -163,10 +163,8 @@ async def run_agent(
 
     # PlaywrightLogger 싱글톤 인스턴스 초기화
     try:
-        import browser_use.playwright_logger
         from browser_use.playwright_logger import get_playwright_logger
-        browser_use.playwright_logger._instance = None
-        logger = get_playwright_logger(log_dir=log_dir)
+        logger = get_playwright_logger(log_dir=log_dir, reset=True)
     except Exception as e:
         print(f"PlaywrightLogger 초기화 오류: {e}")
 
@@ -41,15 +41,11 @@ LOG_DIR = os.environ.get('PLAYWRIGHT_LOG_DIR',
 if LOG_DIR.startswith('./'):
     LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', LOG_DIR[2:]))
 
-# 싱글톤 인스턴스 초기화를 위해 모듈 변수 직접 접근
-import browser_use.playwright_logger
-browser_use.playwright_logger._instance = None
-
 # Controller 클래스의 act 메서드를 몽키패치하여 디버깅 정보 추가
 from browser_use.controller.service import Controller
 original_act = Controller.act
 
-async def debug_act(self, action, browser_context):
+async def debug_act(self, action, browser_context, selector_map=None):
     """액션 실행 전에 디버깅 정보를 출력하는 래퍼 함수"""
     logger.debug(f"실행 액션: {action}")
     
@@ -67,7 +63,7 @@ async def debug_act(self, action, browser_context):
             logger.debug(f"텍스트: {params.text}")
     
     # 원래 메서드 호출
-    return await original_act(self, action, browser_context)
+    return await original_act(self, action, browser_context, selector_map=selector_map)
 
 # 몽키패치 적용
 Controller.act = debug_act
@@ -84,14 +80,14 @@ def print_log_summary(log_dir):
         with open(json_log_file, 'r', encoding='utf-8') as f:
             log_data = json.load(f)
         
-        formatted_actions = log_data.get("formatted_actions", [])
+        # pre_action은 건너뛰고 post_action만 표시
+        post_actions = [
+            action for action in log_data.get("formatted_actions", [])
+            if action.get("phase", "") == "post_action"
+        ]
         
         print("\n=== 액션 로그 요약 ===")
-        for i, action in enumerate(formatted_actions):
-            phase = action.get("phase", "")
-            if phase == "pre_action":
-                continue  # pre_action은 건너뛰고 post_action만 표시
-            
+        for i, action in enumerate(post_actions):
             action_type = action.get("action_type", "")
             timestamp = action.get("timestamp", "")
             
@@ -158,7 +154,7 @@ def print_log_summary(log_dir):
             
             print()
         
-        print(f"총 {len(formatted_actions)//2}개의 액션이 실행되었습니다.")
+        print(f"총 {len(post_actions)}개의 액션이 실행되었습니다.")
         print(f"상세 로그는 {log_dir} 디렉토리에서 확인할 수 있습니다.")
         
     except Exception as e:
@@ -170,7 +166,7 @@ async def main():
     print(f"로그 디렉토리: {LOG_DIR}")
     
     # 로거 초기화
-    logger = get_playwright_logger(log_dir=LOG_DIR, session_id=SESSION_ID)
+    logger = get_playwright_logger(log_dir=LOG_DIR, session_id=SESSION_ID, reset=True)
     
     # LLM 설정
     llm = ChatOpenAI(
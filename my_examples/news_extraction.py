@@ -4,9 +4,12 @@
 """
 
 import asyncio
-import json
 import os
 import sys
+from pathlib import Path
+
+import orjson
+from pydantic import BaseModel, HttpUrl, ValidationError
 
 # 로컬 모듈 경로 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -14,23 +17,40 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from langchain_openai import ChatOpenAI
 
 # 로컬 모듈 import
-from browser_use import Agent, Browser
+from browser_use import Agent, Browser, Controller
 from browser_use.playwright_logger import get_playwright_logger
 
+# uvloop이 설치되어 있으면 더 빠른 이벤트 루프를 사용 (Windows는 uvloop를 지원하지 않음)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 # 로그 디렉토리 설정
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 
-# 출력 형식 정의 (JSON 스키마)
-OUTPUT_SCHEMA = {
-    "articles": [
-        {
-            "title": "str",
-            "url": "str",
-            "summary": "str",
-            "source": "str"
-        }
-    ]
-}
+# 출력 형식 정의 (done 액션의 파라미터 스키마로 사용되어 LLM 출력이 이 형식으로 검증됨)
+class Article(BaseModel):
+    title: str
+    url: HttpUrl
+    summary: str
+    source: str
+
+
+class ArticleList(BaseModel):
+    articles: list[Article]
+
+
+# 에이전트에 전달할 작업 내용
+TASK = """
+1. Go to https://news.ycombinator.com/
+2. Extract the top 5 news articles
+3. For each article, get the title, URL, a brief summary and the source website
+4. Return the results
+"""
+
 
 async def main():
     # 로거 초기화
@@ -42,26 +62,12 @@ async def main():
     # LLM 설정
     llm = ChatOpenAI(model="gpt-4o")
     
-    # 에이전트 설정
+    # 에이전트 설정 (형식이 맞지 않는 결과는 done 액션 검증 오류로 LLM에 전달되어 다시 시도됨)
     agent = Agent(
-        task="""
-        1. Go to https://news.ycombinator.com/
-        2. Extract the top 5 news articles
-        3. For each article, get the title, URL, and a brief summary
-        4. Return the results as a JSON with the following structure:
-           {
-             "articles": [
-               {
-                 "title": "Article title",
-                 "url": "Article URL",
-                 "summary": "Brief summary",
-                 "source": "Source website"
-               }
-             ]
-           }
-        """,
+        task=TASK,
         llm=llm,
         browser=browser,
+        controller=Controller(output_model=ArticleList),
         use_vision=True
     )
     
@@ -75,23 +81,23 @@ async def main():
             for res in history_item.result:
                 if res.extracted_content and res.is_done:
                     try:
-                        # JSON 형식으로 파싱
-                        articles_data = json.loads(res.extracted_content)
+                        # 스키마에 맞춰 파싱
+                        articles_data = ArticleList.model_validate_json(res.extracted_content)
                         
                         # 결과 저장
                         output_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "news_articles.json")
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(articles_data, f, ensure_ascii=False, indent=2)
+                        # orjson은 UTF-8 바이트를 바로 만들므로 그대로 기록 (파일 쓰기는 이벤트 루프를 막지 않도록 별도 스레드에서)
+                        output_bytes = orjson.dumps(articles_data.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+                        await asyncio.to_thread(Path(output_file).write_bytes, output_bytes)
                         
                         print(f"뉴스 기사가 {output_file}에 저장되었습니다.")
                         
                         # 간단한 요약 출력
-                        if "articles" in articles_data:
-                            for idx, article in enumerate(articles_data["articles"]):
-                                print(f"\n기사 {idx+1}: {article['title']}")
-                                print(f"출처: {article['source']}")
-                                print(f"요약: {article['summary']}")
-                    except json.JSONDecodeError:
+                        for idx, article in enumerate(articles_data.articles):
+                            print(f"\n기사 {idx+1}: {article.title}")
+                            print(f"출처: {article.source}")
+                            print(f"요약: {article.summary}")
+                    except ValidationError:
                         print(res.extracted_content)
     
     # Playwright 코드 생성
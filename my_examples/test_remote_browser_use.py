@@ -1,17 +1,33 @@
 import sys
 import os
-import requests
+import glob
+import inspect
+import httpx
 import asyncio
+import shutil
+import signal
 import subprocess
 import logging
-import json
-import time
+import orjson
+import hashlib
+import functools
 import platform
+from dataclasses import dataclass
+from datetime import datetime
 from dotenv import load_dotenv
+from pydantic import BaseModel, ValidationError
 from langchain_openai import ChatOpenAI
-from browser_use import Agent, Browser, BrowserConfig
+from browser_use import Agent, Browser, BrowserConfig, Controller
 from browser_use.browser.context import BrowserContext, BrowserContextConfig
 
+# uvloop이 설치되어 있으면 더 빠른 이벤트 루프를 사용 (Windows는 uvloop를 지원하지 않음)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 # 1. 이 프로그램의 로그는 항상 고정 경로 (절대 경로로 직접 지정)
 my_program_log_dir = "/Users/bombbie/Developer/browser-use-fork/my_examples/logs"
 os.makedirs(my_program_log_dir, exist_ok=True)
@@ -29,191 +45,448 @@ os.makedirs(browser_use_log_dir, exist_ok=True)
 # 환경변수 로드
 load_dotenv()
 
+# 작업 사이에 유지할 쿠키 파일 (BrowserPool이 관리)
+COOKIES_FILE = "/tmp/cookies.json"
+# 디버깅 모드 Chrome이 사용하는 프로필 디렉토리
+CHROME_USER_DATA_DIR = os.path.join(os.path.expanduser("~"), ".chrome-debug-data")
+# 이 프로세스가 띄운 Chrome (PID -> Popen)
+_CHROME_PROCESSES = {}
+# 실행 중인 OS (프로세스 동안 바뀌지 않음)
+_SYSTEM = platform.system()
+# 새로 띄운 Chrome의 디버깅 엔드포인트가 응답할 때까지 기다리는 최대 시간 (초)
+CHROME_READY_TIMEOUT = 10.0
+# TASK_FILE_PATH가 디렉토리일 때 동시에 실행할 최대 작업 수
+MAX_PARALLEL_TASKS = int(os.environ.get("MAX_PARALLEL_TASKS", "3"))
+# Agent가 사용하는 LLM 모델
+LLM_MODEL = "gpt-4o"
+# 같은 task의 실행 결과를 재사용하는 캐시 디렉토리 (지정하지 않으면 캐시를 사용하지 않음)
+AGENT_CACHE_DIR = os.environ.get("AGENT_CACHE_DIR", "")
+# 프롬프트나 결과 형식을 바꾸면 올려서 이전 캐시를 무효화
+PROMPT_VERSION = "1"
+
+
+def _patch_playwright_stack():
+    # PW_INSPECT_STACK=0이면 Playwright가 API 호출마다 수집하는 호출 스택을 생략 (CPU 사용량 감소)
+    # 대신 Playwright 오류 메시지의 API 이름과 tracing의 호출 위치 정보가 빠짐
+    if os.environ.get("PW_INSPECT_STACK", "1") != "0":
+        return
+    from playwright._impl import _connection
+    if getattr(_connection, "_stack_patched", False):
+        return
+    if hasattr(_connection, "_capture_stack_trace"):
+        # 최근 버전: 프레임을 직접 순회하는 _capture_stack_trace를 빈 결과로 대체
+        _connection._capture_stack_trace = lambda: {"frames": [], "apiName": "", "title": None}
+    else:
+        # 이전 버전: wrap_api_call이 매번 inspect.stack()을 호출하므로 이 모듈에서만 빈 목록을 반환하도록 대체
+        class _NoStackInspect:
+            def __getattr__(self, name):
+                return getattr(inspect, name)
+
+            @staticmethod
+            def stack(*args, **kwargs):
+                return []
+
+        _connection.inspect = _NoStackInspect()
+    _connection._stack_patched = True
+    print("Playwright 호출 스택 수집 비활성화 (PW_INSPECT_STACK=0)")
 
-def is_chrome_debugging_available(port=9222, retries=3, retry_interval=2):
+
+# Chrome 디버깅 엔드포인트 확인용 HTTP 클라이언트 (모든 확인 요청이 keep-alive 연결을 재사용)
+_PROBE_CLIENT = httpx.AsyncClient(timeout=1.0, limits=httpx.Limits(max_keepalive_connections=2))
+
+
+async def is_chrome_debugging_available(port=9222, retries=3, retry_interval=0.05):
     url = f"http://127.0.0.1:{port}/json/version"
     for attempt in range(retries):
         try:
-            response = requests.get(url, timeout=3)
+            response = await _PROBE_CLIENT.get(url)
             if response.status_code == 200:
                 print(f"기존 Chrome 디버깅 세션 발견 (포트: {port})")
                 return True
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"연결 시도 {attempt + 1}/{retries} 실패: {e}")
         if attempt < retries - 1:
-            time.sleep(retry_interval)
+            # 재시도 간격은 50ms, 100ms, 200ms...로 늘림
+            await asyncio.sleep(retry_interval * 2 ** attempt)
     return False
 
 
-def kill_existing_chrome():
-    system = platform.system()
+async def _poll_until_ready(port, interval=0.1):
+    # 디버깅 엔드포인트가 응답할 때까지 짧은 간격으로 확인 (시간 제한은 호출하는 쪽에서 asyncio.wait_for로 지정)
+    url = f"http://127.0.0.1:{port}/json/version"
+    while True:
+        try:
+            response = await _PROBE_CLIENT.get(url)
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(interval)
+
+
+async def _find_debug_chrome_pids():
+    # 디버깅용 user-data-dir로 실행된 Chrome만 찾음 (사용자가 띄운 일반 Chrome 창은 건드리지 않음)
+    proc = await asyncio.create_subprocess_exec(
+        "pgrep", "-f", "--", f"--user-data-dir={CHROME_USER_DATA_DIR}", stdout=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await proc.communicate()
+    return {int(pid) for pid in stdout.split()}
+
+
+async def _wait_pid_gone(pid, interval=0.05):
+    # 직접 띄운 프로세스는 종료 후 회수(poll)해야 하므로 Popen으로 확인, 그 외는 시그널 0으로 존재 여부만 확인
+    process = _CHROME_PROCESSES.get(pid)
+    while True:
+        if process is not None:
+            if process.poll() is not None:
+                return
+        else:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return
+        await asyncio.sleep(interval)
+
+
+async def kill_existing_chrome():
     try:
-        if system == "Darwin":
-            subprocess.run(["pkill", "-f", "Google Chrome"], check=False)
-        elif system == "Windows":
+        if _SYSTEM == "Windows":
             subprocess.run(["taskkill", "/f", "/im", "chrome.exe"], check=False)
-        else:
-            subprocess.run(["pkill", "-f", "chrome"], check=False)
+            print("기존 Chrome 프로세스를 종료했습니다.")
+            await asyncio.sleep(2)
+            return
+        pids = set(_CHROME_PROCESSES) | await _find_debug_chrome_pids()
+        if not pids:
+            return
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        # 고정 시간만큼 기다리지 않고 실제로 종료될 때까지만 기다림 (최대 2초)
+        try:
+            await asyncio.wait_for(asyncio.gather(*(_wait_pid_gone(pid) for pid in pids)), timeout=2.0)
+        except asyncio.TimeoutError:
+            print("일부 Chrome 프로세스가 2초 안에 종료되지 않았습니다.")
+        _CHROME_PROCESSES.clear()
         print("기존 Chrome 프로세스를 종료했습니다.")
-        time.sleep(2)
     except Exception as e:
         print(f"Chrome 프로세스 종료 중 오류: {e}")
 
 
-def start_chrome_debugging(port=9222, kill_existing=True):
-    system = platform.system()
-    if kill_existing:
-        kill_existing_chrome()
-    temp_dir = os.path.join(os.path.expanduser("~"), ".chrome-debug-data")
-    os.makedirs(temp_dir, exist_ok=True)
-    if system == "Darwin":
+@functools.lru_cache(maxsize=1)
+def _resolve_chrome_path():
+    # Chrome 실행 파일 경로는 프로세스 동안 바뀌지 않으므로 처음 찾은 결과를 재사용 (찾지 못해 예외가 나면 캐시하지 않음)
+    if _SYSTEM == "Darwin":
         chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-    elif system == "Windows":
+        if not os.path.exists(chrome_path):
+            raise Exception(f"Chrome 실행 파일을 찾을 수 없습니다: {chrome_path}")
+        return chrome_path
+    if _SYSTEM == "Windows":
         chrome_paths = [
             "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
             "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
         ]
-        chrome_path = None
         for path in chrome_paths:
             if os.path.exists(path):
-                chrome_path = path
-                break
-        if not chrome_path:
-            raise Exception("Chrome 실행 파일을 찾을 수 없습니다.")
-    else:
-        chrome_path = "google-chrome"
-    if system == "Darwin" and not os.path.exists(chrome_path):
-        raise Exception(f"Chrome 실행 파일을 찾을 수 없습니다: {chrome_path}")
+                return path
+        raise Exception("Chrome 실행 파일을 찾을 수 없습니다.")
+    return "google-chrome"
+
+
+@dataclass(frozen=True)
+class ChromeFlagProfile:
+    name: str
+    args: tuple = ()
+
+
+# 모든 프로필에 공통으로 쓰는 Chrome 플래그
+_BASE_CHROME_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--remote-allow-origins=*",
+)
+# 화면 없이 많은 작업을 처리할 때 쓰는 플래그 (백그라운드 통신/동기화/감시 기능을 끔)
+_THROUGHPUT_CHROME_ARGS = (
+    "--headless=new",
+    "--disable-dev-shm-usage",
+    "--disable-gpu-sandbox",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--disable-ipc-flooding-protection",
+    "--disable-hang-monitor",
+)
+# debug: 창을 띄워 지켜보는 기존 방식, vision: headless, scrape: headless + 이미지 로딩 끔 (use_vision=False일 때만 사용)
+CHROME_FLAG_PROFILES = {
+    "debug": ChromeFlagProfile("debug", ("--disable-web-security",)),
+    "vision": ChromeFlagProfile("vision", _THROUGHPUT_CHROME_ARGS),
+    "scrape": ChromeFlagProfile("scrape", _THROUGHPUT_CHROME_ARGS + ("--blink-settings=imagesEnabled=false",)),
+}
+CHROME_FLAG_PROFILE = CHROME_FLAG_PROFILES.get(
+    os.environ.get("CHROME_FLAG_PROFILE", "debug").lower(), CHROME_FLAG_PROFILES["debug"]
+)
+# 컨테이너 안에서는 Chrome 샌드박스를 쓸 수 없는 경우가 많으므로 끔
+_IN_CONTAINER = os.path.exists("/.dockerenv")
+
+
+async def start_chrome_debugging(port=9222, kill_existing=True, profile=None):
+    profile = profile or CHROME_FLAG_PROFILE
+    if kill_existing:
+        await kill_existing_chrome()
+    os.makedirs(CHROME_USER_DATA_DIR, exist_ok=True)
+    chrome_path = _resolve_chrome_path()
     cmd = [
         chrome_path,
         f"--remote-debugging-port={port}",
-        f"--user-data-dir={temp_dir}",
-        "--no-first-run",
-        "--no-default-browser-check",
-        "--disable-extensions",
-        "--disable-plugins",
-        "--disable-background-timer-throttling",
-        "--disable-renderer-backgrounding",
-        "--disable-backgrounding-occluded-windows",
-        "--remote-allow-origins=*",
-        "--disable-web-security",
-        "--disable-features=VizDisplayCompositor",
+        f"--user-data-dir={CHROME_USER_DATA_DIR}",
+        *_BASE_CHROME_ARGS,
+        *profile.args,
     ]
+    if _IN_CONTAINER:
+        cmd.append("--no-sandbox")
+    print(f"Chrome 플래그 프로필: {profile.name}")
     try:
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            preexec_fn=os.setsid if system != "Windows" else None,
+            start_new_session=_SYSTEM != "Windows",
         )
+        _CHROME_PROCESSES[process.pid] = process
         print(f"Chrome 디버깅 모드로 시작됨 (PID: {process.pid}, 포트: {port})")
-        for i in range(10):
-            if is_chrome_debugging_available(port):
-                print(f"Chrome 디버깅 세션 준비 완료 (시도: {i+1})")
-                return process
-            print(f"Chrome 시작 대기 중... ({i+1}/10)")
-            time.sleep(1)
-        print("Chrome 디버깅 세션이 시작되었지만 연결할 수 없습니다.")
+        try:
+            await asyncio.wait_for(_poll_until_ready(port), timeout=CHROME_READY_TIMEOUT)
+            print("Chrome 디버깅 세션 준비 완료")
+        except asyncio.TimeoutError:
+            print("Chrome 디버깅 세션이 시작되었지만 연결할 수 없습니다.")
         return process
     except Exception as e:
         print(f"Chrome 시작 중 오류 발생: {e}")
         return None
 
 
-async def run_agent(task, save_conversation_path="/tmp/conversation.json", use_vision=False):
-    browser = None
-    context = None
-    chrome_process = None
+class BrowserPool:
+    """프로세스 전체에서 Chrome 디버깅 세션에 연결한 Browser 하나를 공유하고, 작업마다 BrowserContext만 새로 만들어 빌려줌"""
+
+    def __init__(self, debugging_port=9222, cookies_file=None):
+        self.debugging_port = debugging_port
+        self.browser = None
+        self.chrome_process = None
+        # 동시에 실행되는 run_agent들이 Chrome을 여러 번 띄우지 않도록 Browser 생성은 한 번에 하나만
+        self._lock = asyncio.Lock()
+        # 쿠키는 처음 한 번만 파일에서 읽고, 이후에는 메모리에 둔 것을 새 BrowserContext에 넣음 (파일 쓰기는 close() 때 한 번)
+        self.cookies_file = cookies_file
+        self._cookies = self._load_cookies()
+
+    def _load_cookies(self):
+        if not self.cookies_file or not os.path.exists(self.cookies_file):
+            return None
+        try:
+            with open(self.cookies_file, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError) as e:
+            print(f"쿠키 파일 읽기 오류: {e}")
+            return None
+
+    def _save_cookies(self):
+        if not self.cookies_file or self._cookies is None:
+            return
+        try:
+            dirname = os.path.dirname(self.cookies_file)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            tmp_path = f"{self.cookies_file}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(self._cookies))
+            os.replace(tmp_path, self.cookies_file)
+        except OSError as e:
+            print(f"쿠키 파일 저장 오류: {e}")
+
+    def _connect_cdp(self):
+        return Browser(
+            config=BrowserConfig(
+                headless=False,
+                cdp_url=f"http://127.0.0.1:{self.debugging_port}",
+            )
+        )
+
+    async def _create_browser(self):
+        if await is_chrome_debugging_available(port=self.debugging_port):
+            print("기존 Chrome 디버깅 세션에 연결 시도...")
+            try:
+                browser = self._connect_cdp()
+                print("기존 Chrome 세션에 연결 성공")
+                return browser
+            except Exception as e:
+                print(f"기존 Chrome 세션 연결 실패: {e}")
+        print("새 Chrome 디버깅 세션 시작...")
+        self.chrome_process = await start_chrome_debugging(port=self.debugging_port)
+        if self.chrome_process and await is_chrome_debugging_available(port=self.debugging_port):
+            try:
+                browser = self._connect_cdp()
+                print("새 Chrome 디버깅 세션에 연결 성공")
+                return browser
+            except Exception as e:
+                print(f"새 Chrome 디버깅 세션 연결 실패: {e}")
+        print("직접 Chrome 인스턴스 생성...")
+        browser = Browser(
+            config=BrowserConfig(
+                headless=False,
+                chrome_instance_path="/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            )
+        )
+        print("직접 Chrome 인스턴스 생성 성공")
+        return browser
+
+    async def get_browser(self):
+        async with self._lock:
+            if self.browser is None:
+                browser = await self._create_browser()
+                # CDP 연결을 여기서 미리 맺어 둠. 동시에 시작한 작업들이 각자 연결을 맺지 않고 이 연결 하나를 함께 사용
+                if browser is not None:
+                    await browser.get_playwright_browser()
+                self.browser = browser
+            return self.browser
+
+    async def acquire_context(self, config):
+        browser = await self.get_browser()
+        context = await browser.new_context(config)
+        if self._cookies:
+            session = await context.get_session()
+            await session.context.add_cookies(self._cookies)
+        return context
+
+    async def release(self, context):
+        if context.session is not None:
+            try:
+                self._cookies = await context.session.context.cookies()
+            except Exception as e:
+                print(f"쿠키 가져오기 오류: {e}")
+        await context.close()
+
+    async def close(self):
+        async with self._lock:
+            if self.browser is not None:
+                await self.browser.close()
+                self.browser = None
+            self._save_cookies()
+
+
+_POOL = BrowserPool(cookies_file=COOKIES_FILE)
+
+
+class CachedAgentRun(BaseModel):
+    timestamp: str
+    model: str
+    task: str
+    result: str
+
+
+def _agent_cache_path(task, use_vision):
+    if not AGENT_CACHE_DIR:
+        return None
+    # 줄바꿈/들여쓰기만 다른 같은 task가 같은 키를 갖도록 공백을 정규화
+    normalized_task = " ".join(task.split())
+    # 필드마다 8바이트 길이를 앞에 붙여 해시 (필드 경계가 달라도 같은 키가 나오지 않도록)
+    digest = hashlib.sha256()
+    for field in ("openai", LLM_MODEL, PROMPT_VERSION, str(use_vision), normalized_task):
+        data = field.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    key = digest.hexdigest()
+    return os.path.join(os.path.expanduser(AGENT_CACHE_DIR), key[:2], f"{key}.json")
+
+
+def _load_cached_run(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            return CachedAgentRun.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        print(f"캐시 읽기 오류: {e}")
+        return None
+
+
+def _save_cached_run(cache_path, task, final_result):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        entry = CachedAgentRun(timestamp=datetime.now().isoformat(), model=LLM_MODEL, task=task, result=final_result)
+        # 다른 실행이 읽는 중에도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(entry.model_dump_json())
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"캐시 저장 오류: {e}")
+
+
+async def run_agent(task, save_conversation_path="/tmp/conversation.json", use_vision=False, log_dir=browser_use_log_dir):
     print("initializing config...")
     load_dotenv()
-    try:
-        import browser_use.playwright_logger
-        from browser_use.playwright_logger import get_playwright_logger
-        browser_use.playwright_logger._instance = None
-        logger = get_playwright_logger(log_dir=browser_use_log_dir)
-    except Exception as e:
-        print(f"PlaywrightLogger 초기화 오류: {e}")
+    cache_path = _agent_cache_path(task, use_vision)
+    run_log_file = os.path.join(log_dir, "automation_log.log")
+    cached = _load_cached_run(cache_path) if cache_path else None
+    if cached is not None:
+        # 같은 task를 이미 완료한 적이 있으면 브라우저와 LLM 없이 저장된 결과를 반환
+        print(f"캐시된 실행 결과 사용 ({cached.timestamp}): {cache_path}")
+        combined_result = f"{cached.result}\n\n--- AUTOMATION LOG ---\n\n{run_log_file}"
+        print(combined_result)
+        return combined_result
+    _patch_playwright_stack()
     config = BrowserContextConfig(
-        cookies_file="/tmp/cookies.json",
         wait_for_network_idle_page_load_time=3.0,
         browser_window_size={"width": 1280, "height": 1100},
         locale="en-US",
-        highlight_elements=True,
-        viewport_expansion=500,
+        # 스크린샷을 보지 않으면(use_vision=False) 요소 하이라이트와 화면 밖 요소 수집은 불필요한 비용
+        highlight_elements=use_vision,
+        viewport_expansion=500 if use_vision else 0,
         save_recording_path=browser_use_log_dir,
     )
     print(f"BrowserContextConfig 생성 완료 => {config}")
-    debugging_port = 9222
-    browser_created = False
     try:
-        if is_chrome_debugging_available(port=debugging_port):
-            print("기존 Chrome 디버깅 세션에 연결 시도...")
-            try:
-                browser = Browser(
-                    config=BrowserConfig(
-                        headless=False,
-                        cdp_url=f"http://127.0.0.1:{debugging_port}",
-                    )
-                )
-                browser_created = True
-                print("기존 Chrome 세션에 연결 성공")
-            except Exception as e:
-                print(f"기존 Chrome 세션 연결 실패: {e}")
-        if not browser_created:
-            print("새 Chrome 디버깅 세션 시작...")
-            chrome_process = start_chrome_debugging(port=debugging_port)
-            if chrome_process and is_chrome_debugging_available(port=debugging_port):
-                try:
-                    browser = Browser(
-                        config=BrowserConfig(
-                            headless=False,
-                            cdp_url=f"http://127.0.0.1:{debugging_port}",
-                        )
-                    )
-                    browser_created = True
-                    print("새 Chrome 디버깅 세션에 연결 성공")
-                except Exception as e:
-                    print(f"새 Chrome 디버깅 세션 연결 실패: {e}")
-        if not browser_created:
-            print("직접 Chrome 인스턴스 생성...")
-            browser = Browser(
-                config=BrowserConfig(
-                    headless=False,
-                    chrome_instance_path="/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                )
-            )
-            browser_created = True
-            print("직접 Chrome 인스턴스 생성 성공")
+        browser = await _POOL.get_browser()
     except Exception as e:
         error_msg = f"Browser 초기화 최종 실패: {str(e)}"
         print(error_msg)
         return error_msg
-    if not browser_created or browser is None:
+    if browser is None:
         error_msg = "모든 브라우저 연결 방법이 실패했습니다."
         print(error_msg)
         return error_msg
     print(f"Browser 생성 완료 => {browser}")
     try:
-        context = BrowserContext(config=config, browser=browser)
+        context = await _POOL.acquire_context(config)
         print("BrowserContext 생성 완료")
     except Exception as e:
         error_msg = f"BrowserContext 초기화 오류: {str(e)}"
         print(error_msg)
         return error_msg
+    controller = None
     try:
-        llm = ChatOpenAI(model="gpt-4o")
+        llm = ChatOpenAI(model=LLM_MODEL)
         print("LLM 생성 완료")
+        # Agent의 기본 Controller는 모든 Agent가 공유하므로 실행마다 새로 만들어 로거와 액션 상태를 분리
+        controller = Controller(log_dir=log_dir)
         print("Agent 생성 중...")
         agent = Agent(
             browser_context=context,
             task=task,
             llm=llm,
+            controller=controller,
             save_conversation_path=save_conversation_path,
             use_vision=use_vision,
         )
         print("Agent 생성 완료")
         print(f"실행할 작업: {task}")
         result = await agent.run()
+        is_done = False
         try:
             final_result = (
                 result.final_result()
@@ -233,51 +506,95 @@ async def run_agent(task, save_conversation_path="/tmp/conversation.json", use_v
         error_msg = f"Agent 실행 오류: {str(e)}"
         print(error_msg)
         return error_msg
-    log_file_path = os.path.join(browser_use_log_dir, "automation_log.log")
-    log_content = ""
-    try:
-        if os.path.exists(log_file_path):
-            with open(log_file_path, "r", encoding="utf-8") as f:
-                log_content = f.read()
-            print(f"로그 파일 읽기 성공: {log_file_path}")
-        else:
-            log_content = "로그 파일을 찾을 수 없습니다."
-            print(f"로그 파일 없음: {log_file_path}")
-    except Exception as e:
-        log_content = f"로그 파일 읽기 오류: {str(e)}"
-        print(f"로그 파일 읽기 오류: {e}")
+    finally:
+        # 이번 실행의 로거는 더 쓰지 않으므로 I/O 스레드와 파일 핸들을 바로 정리
+        if controller is not None:
+            await controller.logger.aclose()
+        # Browser는 다음 작업을 위해 남겨두고 이번 작업의 BrowserContext만 닫음
+        await _POOL.release(context)
     if not isinstance(final_result, str):
         try:
-            final_result = json.dumps(final_result, ensure_ascii=False, indent=2)
+            final_result = orjson.dumps(final_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
         except:
             final_result = str(final_result)
-    combined_result = f"{final_result}\n\n--- AUTOMATION LOG ---\n\n{log_content}"
+    # 완료된 실행만 캐시에 저장
+    if cache_path and is_done:
+        _save_cached_run(cache_path, task, final_result)
+    # 로그 내용은 main()에서 한 번만 읽으므로 여기서는 경로만 붙임
+    combined_result = f"{final_result}\n\n--- AUTOMATION LOG ---\n\n{run_log_file}"
     print("Agent 실행 완료")
     print(combined_result)
     return combined_result
 
 
+async def _bounded_gather(coros, limit):
+    # 동시에 실행되는 작업 수를 limit개로 제한 (각 작업은 공유 Browser에서 자기 BrowserContext를 사용)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
+def _task_log_dirs(task_count):
+    # 작업이 하나면 기존 위치, 여러 개를 동시에 실행하면 작업마다 하위 디렉토리 (같은 로그 파일을 덮어쓰지 않도록)
+    if task_count == 1:
+        return [browser_use_log_dir]
+    return [os.path.join(browser_use_log_dir, f"task_{i}") for i in range(task_count)]
+
+
+async def _run_agents_and_close_pool(tasks):
+    try:
+        if len(tasks) == 1:
+            return [await run_agent(tasks[0])]
+        return await _bounded_gather(
+            [
+                run_agent(task, save_conversation_path=f"/tmp/conversation_{i}.json", log_dir=log_dir)
+                for i, (task, log_dir) in enumerate(zip(tasks, _task_log_dirs(len(tasks))))
+            ],
+            limit=MAX_PARALLEL_TASKS,
+        )
+    finally:
+        await _POOL.close()
+        await _PROBE_CLIENT.aclose()
+
+
 def main():
-    task_file = os.environ.get("TASK_FILE_PATH")
-    if not task_file or not os.path.exists(task_file):
-        print("환경변수 TASK_FILE_PATH에 유효한 파일 경로를 지정하세요.")
+    task_path = os.environ.get("TASK_FILE_PATH")
+    if not task_path or not os.path.exists(task_path):
+        print("환경변수 TASK_FILE_PATH에 유효한 파일 또는 디렉토리 경로를 지정하세요.")
         sys.exit(1)
-    with open(task_file, "r", encoding="utf-8") as f:
-        task = f.read().strip()
-    print(f"TASK: {task}")
-    asyncio.run(run_agent(task))
-
-    # 로그 파일 경로 및 내용 출력
-    log_file_path = os.path.join(browser_use_log_dir, "automation_log.log")
-    print(f"로그 파일 경로: {log_file_path}")
-    if os.path.exists(log_file_path):
-        with open(log_file_path, "r", encoding="utf-8") as f:
-            log_content = f.read()
-        print("--- 로그 파일 내용 ---")
-        print(log_content)
+    # 디렉토리를 지정하면 그 안의 모든 .txt 파일을 각각 하나의 task로 실행
+    if os.path.isdir(task_path):
+        task_files = sorted(glob.glob(os.path.join(task_path, "*.txt")))
     else:
-        print("로그 파일이 존재하지 않습니다.")
-    print(f"로그 파일 경로: {log_file_path}")
+        task_files = [task_path]
+    tasks = []
+    for task_file in task_files:
+        with open(task_file, "r", encoding="utf-8") as f:
+            tasks.append(f.read().strip())
+    if not tasks:
+        print(f"실행할 task 파일(*.txt)이 없습니다: {task_path}")
+        sys.exit(1)
+    for task in tasks:
+        print(f"TASK: {task}")
+    asyncio.run(_run_agents_and_close_pool(tasks))
+
+    # 로그 파일 경로 및 내용 출력 (작업별 로그 디렉토리마다)
+    for log_dir in _task_log_dirs(len(tasks)):
+        task_log_file = os.path.join(log_dir, "automation_log.log")
+        print(f"로그 파일 경로: {task_log_file}")
+        if os.path.exists(task_log_file):
+            print("--- 로그 파일 내용 ---")
+            # 로그가 커도 전체를 메모리에 올리지 않도록 조금씩 읽어 그대로 출력
+            with open(task_log_file, "r", encoding="utf-8") as f:
+                shutil.copyfileobj(f, sys.stdout)
+            print()
+        else:
+            print("로그 파일이 존재하지 않습니다.")
+        print(f"로그 파일 경로: {task_log_file}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
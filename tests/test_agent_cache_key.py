@@ -0,0 +1,96 @@
+import asyncio
+import importlib.util
+import logging
+import os
+
+import pytest
+
+# run with:
+# python -m pytest tests/test_agent_cache_key.py
+
+SCRIPT_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'my_examples', 'test_remote_browser_use.py')
+
+
+@pytest.fixture
+def script(tmp_path, monkeypatch):
+	"""Loads the remote browser example script without its import-time side effects outside tmp_path"""
+	monkeypatch.setenv('PLAYWRIGHT_LOG_DIR', str(tmp_path / 'logs'))
+	monkeypatch.setenv('AGENT_CACHE_DIR', str(tmp_path / 'cache'))
+	# The script points its own log file at a fixed developer path and may install the uvloop policy
+	real_makedirs = os.makedirs
+
+	def makedirs_under_tmp_path(path, *args, **kwargs):
+		if str(path).startswith(str(tmp_path)):
+			real_makedirs(path, *args, **kwargs)
+
+	monkeypatch.setattr(os, 'makedirs', makedirs_under_tmp_path)
+	monkeypatch.setattr(logging, 'basicConfig', lambda **kwargs: None)
+	policy = asyncio.get_event_loop_policy()
+
+	spec = importlib.util.spec_from_file_location('remote_browser_use_script', SCRIPT_PATH)
+	module = importlib.util.module_from_spec(spec)
+	try:
+		spec.loader.exec_module(module)  # type: ignore
+	finally:
+		asyncio.set_event_loop_policy(policy)
+		monkeypatch.setattr(os, 'makedirs', real_makedirs)
+	return module
+
+
+def test_cache_key_ignores_whitespace_differences(script):
+	assert script._agent_cache_path('Search for  cats\n on google', False) == script._agent_cache_path(
+		'  Search for cats on google  ', False
+	)
+
+
+def test_cache_key_depends_on_task_and_vision(script):
+	path = script._agent_cache_path('Search for cats', False)
+
+	assert path != script._agent_cache_path('Search for dogs', False)
+	assert path != script._agent_cache_path('Search for cats', True)
+
+
+def test_cache_key_depends_on_model_and_prompt_version(script, monkeypatch):
+	path = script._agent_cache_path('Search for cats', False)
+
+	monkeypatch.setattr(script, 'LLM_MODEL', 'gpt-4o-mini')
+	assert script._agent_cache_path('Search for cats', False) != path
+
+	monkeypatch.setattr(script, 'LLM_MODEL', 'gpt-4o')
+	monkeypatch.setattr(script, 'PROMPT_VERSION', '2')
+	assert script._agent_cache_path('Search for cats', False) != path
+
+
+def test_cache_key_keeps_field_boundaries(script, monkeypatch):
+	"""Fields that concatenate to the same bytes still give different keys"""
+	monkeypatch.setattr(script, 'LLM_MODEL', 'gpt-4o')
+	monkeypatch.setattr(script, 'PROMPT_VERSION', '12')
+	path = script._agent_cache_path('Search for cats', False)
+
+	monkeypatch.setattr(script, 'LLM_MODEL', 'gpt-4o1')
+	monkeypatch.setattr(script, 'PROMPT_VERSION', '2')
+	assert script._agent_cache_path('Search for cats', False) != path
+
+
+def test_cache_path_is_sharded_under_the_cache_dir(script, tmp_path):
+	path = script._agent_cache_path('Search for cats', False)
+	key = os.path.splitext(os.path.basename(path))[0]
+
+	assert path == os.path.join(str(tmp_path / 'cache'), key[:2], f'{key}.json')
+
+
+def test_caching_is_disabled_without_a_cache_dir(script, monkeypatch):
+	monkeypatch.setattr(script, 'AGENT_CACHE_DIR', '')
+
+	assert script._agent_cache_path('Search for cats', False) is None
+
+
+def test_saved_run_round_trips(script):
+	path = script._agent_cache_path('Search for cats', False)
+
+	script._save_cached_run(path, 'Search for cats', 'result text')
+
+	cached = script._load_cached_run(path)
+	assert cached.task == 'Search for cats'
+	assert cached.result == 'result text'
+	assert cached.model == script.LLM_MODEL
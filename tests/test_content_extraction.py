@@ -0,0 +1,60 @@
+import pytest
+from main_content_extractor import MainContentExtractor
+
+from browser_use.controller.service import _extract_main_content
+
+# run with:
+# python -m pytest tests/test_content_extraction.py
+
+PAGES = {
+	'main_with_articles': """
+		<html><head><title>t</title><script>var x = 1;</script></head><body>
+		<nav>Home | About</nav>
+		<main>
+			<article><h1>First</h1><p>Alpha <a href="https://example.com/a">link</a></p></article>
+			<article><h2>Second</h2><p>Beta</p></article>
+		</main>
+		<footer>Footer</footer>
+		</body></html>
+	""",
+	'main_without_articles': """
+		<html><body><header>Header</header>
+		<main><h1>Title</h1><ul><li>one</li><li>two</li></ul></main>
+		</body></html>
+	""",
+	'articles_without_main': """
+		<html><body><div><article><h3>Post</h3><pre>code  block</pre></article></div>
+		<aside>Sidebar</aside></body></html>
+	""",
+	'table_and_blockquote': """
+		<html><body><div id="contents">
+		<table><tr><th>Name</th><th>Value</th></tr><tr><td>a</td><td>1</td></tr></table>
+		<blockquote>Quoted text</blockquote>
+		</div></body></html>
+	""",
+	'headings_in_divs': """
+		<html><body><div><div><h1>Heading</h1><h5>Small heading</h5><p>Paragraph text</p></div></div></body></html>
+	""",
+}
+
+
+@pytest.mark.parametrize('page', sorted(PAGES))
+@pytest.mark.parametrize('output_format', ['text', 'markdown'])
+def test_matches_main_content_extractor(page, output_format):
+	"""The lxml-based extraction gives the same result as MainContentExtractor.extract on the whole document"""
+	html = PAGES[page]
+	assert _extract_main_content(html, output_format) == MainContentExtractor.extract(html, output_format=output_format)
+
+
+def test_text_output_drops_removed_elements():
+	content = _extract_main_content(PAGES['main_with_articles'], 'text')
+
+	assert 'First' in content and 'Beta' in content
+	assert 'var x' not in content
+	assert 'Footer' not in content
+
+
+def test_markdown_output_keeps_links():
+	content = _extract_main_content(PAGES['main_with_articles'], 'markdown')
+
+	assert '[link](https://example.com/a)' in content
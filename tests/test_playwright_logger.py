@@ -0,0 +1,167 @@
+import gc
+import json
+import os
+
+import pytest
+
+from browser_use import playwright_logger as playwright_logger_module
+from browser_use.playwright_logger import PlaywrightLogger, _now_iso
+
+# run with:
+# python -m pytest tests/test_playwright_logger.py
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+	loggers = []
+
+	def make():
+		playwright_logger = PlaywrightLogger(log_dir=str(tmp_path))
+		loggers.append(playwright_logger)
+		return playwright_logger
+
+	yield make
+	for playwright_logger in loggers:
+		playwright_logger.close()
+
+
+def append_actions(playwright_logger, *action_types):
+	for action_type in action_types:
+		playwright_logger._append_json({'timestamp': _now_iso(), 'action_type': action_type, 'phase': 'post_action'})
+
+
+def read_json_log(playwright_logger):
+	with open(playwright_logger.json_log_file, encoding='utf-8') as f:
+		return json.load(f)
+
+
+class TestSaveJson:
+	def test_finalize_writes_all_actions(self, make_logger):
+		playwright_logger = make_logger()
+		append_actions(playwright_logger, 'click_element', 'input_text')
+
+		playwright_logger.finalize()
+
+		data = read_json_log(playwright_logger)
+		assert data['session_id'] == playwright_logger.session_id
+		assert [action['action_type'] for action in data['formatted_actions']] == ['click_element', 'input_text']
+
+	def test_later_finalize_appends_to_the_saved_file(self, make_logger):
+		playwright_logger = make_logger()
+		append_actions(playwright_logger, 'click_element')
+		playwright_logger.finalize()
+		saved_timestamp = read_json_log(playwright_logger)['timestamp']
+
+		append_actions(playwright_logger, 'input_text', 'scroll_down')
+		playwright_logger.finalize()
+
+		data = read_json_log(playwright_logger)
+		# The file header is left alone when new actions are spliced in instead of rewriting the whole file
+		assert data['timestamp'] == saved_timestamp
+		assert [action['action_type'] for action in data['formatted_actions']] == ['click_element', 'input_text', 'scroll_down']
+
+	def test_unexpected_file_tail_falls_back_to_a_full_rewrite(self, make_logger):
+		playwright_logger = make_logger()
+		append_actions(playwright_logger, 'click_element')
+		playwright_logger.finalize()
+		with open(playwright_logger.json_log_file, 'ab') as f:
+			f.write(b'garbage')
+
+		append_actions(playwright_logger, 'input_text')
+		playwright_logger.finalize()
+
+		data = read_json_log(playwright_logger)
+		assert [action['action_type'] for action in data['formatted_actions']] == ['click_element', 'input_text']
+
+	def test_empty_session_writes_an_empty_action_list(self, make_logger):
+		playwright_logger = make_logger()
+		playwright_logger._json_dirty = True
+
+		playwright_logger.finalize()
+
+		assert read_json_log(playwright_logger)['formatted_actions'] == []
+
+	def test_actions_appended_while_saving_are_saved_next_time(self, make_logger):
+		playwright_logger = make_logger()
+		append_actions(playwright_logger, 'click_element')
+		json_count = playwright_logger._take_json_snapshot()
+		append_actions(playwright_logger, 'input_text')
+
+		playwright_logger._io_executor.submit(playwright_logger._finalize_files, json_count).result()
+		assert [action['action_type'] for action in read_json_log(playwright_logger)['formatted_actions']] == ['click_element']
+
+		playwright_logger.finalize()
+		assert [action['action_type'] for action in read_json_log(playwright_logger)['formatted_actions']] == [
+			'click_element',
+			'input_text',
+		]
+
+
+class TestLogRotation:
+	def test_existing_logs_are_backed_up_and_restarted(self, make_logger, tmp_path):
+		first = make_logger()
+		first.write_log('first session\n')
+		append_actions(first, 'click_element')
+		first.close()
+
+		second = make_logger()
+		second.finalize()
+
+		backups = sorted(name for name in os.listdir(tmp_path) if name.startswith('automation_log_'))
+		assert [os.path.splitext(name)[1] for name in backups] == ['.json', '.jsonl', '.log']
+		with open(tmp_path / next(name for name in backups if name.endswith('.log')), encoding='utf-8') as f:
+			assert 'first session' in f.read()
+		with open(second.log_file, encoding='utf-8') as f:
+			assert 'first session' not in f.read()
+		assert read_json_log(second)['formatted_actions'] == []
+
+	def test_second_logger_in_a_live_dir_does_not_corrupt_the_log(self, make_logger):
+		first = make_logger()
+		first.write_log('first before ' + 'x' * 4096 + '\n')
+		first.finalize()
+
+		second = make_logger()
+		second.finalize()
+		first.write_log('first after\n')
+		first.finalize()
+		second.write_log('second after\n')
+		second.finalize()
+
+		# Both loggers append at the end of the file the second one truncated, instead of at their old offsets
+		with open(first.log_file, 'rb') as f:
+			content = f.read()
+		assert b'\0' not in content
+		assert b'first before' not in content
+		assert content.startswith(b'=== Playwright Automation Log')
+		assert b'first after\n' in content
+		assert b'second after\n' in content
+
+
+class TestLifecycle:
+	def test_unclosed_logger_releases_its_thread_and_files_when_collected(self, tmp_path):
+		playwright_logger = PlaywrightLogger(log_dir=str(tmp_path))
+		playwright_logger.write_log('written before collection\n')
+		io_thread_count = len(playwright_logger._io_executor._threads)
+		log_fp, json_fp = playwright_logger._log_fp, playwright_logger._json_fp
+		io_executor = playwright_logger._io_executor
+
+		del playwright_logger
+		gc.collect()
+
+		# The queued write still reaches the file before the handles are closed on the I/O thread
+		for thread in list(io_executor._threads):
+			thread.join(timeout=5)
+		assert io_thread_count == 1
+		assert not any(thread.is_alive() for thread in io_executor._threads)
+		assert log_fp.closed and json_fp.closed
+		with open(tmp_path / 'automation_log.log', encoding='utf-8') as f:
+			assert 'written before collection' in f.read()
+
+	def test_closed_logger_is_not_closed_again_at_exit(self, make_logger):
+		playwright_logger = make_logger()
+		assert playwright_logger in playwright_logger_module._live_loggers
+
+		playwright_logger.close()
+
+		assert playwright_logger not in playwright_logger_module._live_loggers
+		assert not playwright_logger._finalizer.alive
@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+import pytest
+
+from browser_use.browser.context import BrowserContext
+from browser_use.controller.registry.service import Registry
+
+# run with:
+# python -m pytest tests/test_registry_selector_map.py
+
+
+@pytest.fixture
+def registry():
+	registry = Registry()
+	received = {}
+
+	@registry.action('Action that uses the selector map', requires_browser=True)
+	async def with_selector_map(index: int, browser: BrowserContext, selector_map=None):
+		received['with_selector_map'] = selector_map
+		return index
+
+	@registry.action('Action without a selector map parameter', requires_browser=True)
+	async def without_selector_map(index: int, browser: BrowserContext):
+		received['without_selector_map'] = index
+		return index
+
+	registry.received = received  # type: ignore
+	return registry
+
+
+def test_selector_map_is_not_a_param_model_field(registry):
+	param_model = registry.registry.actions['with_selector_map'].param_model
+
+	assert 'selector_map' not in param_model.model_fields
+	assert 'browser' not in param_model.model_fields
+
+
+async def test_selector_map_is_passed_to_actions_that_accept_it(registry):
+	selector_map = {1: Mock()}
+
+	result = await registry.execute_action('with_selector_map', {'index': 1}, browser=Mock(), selector_map=selector_map)
+
+	assert result == 1
+	assert registry.received['with_selector_map'] is selector_map
+
+
+async def test_selector_map_defaults_to_none(registry):
+	await registry.execute_action('with_selector_map', {'index': 1}, browser=Mock())
+
+	assert registry.received['with_selector_map'] is None
+
+
+async def test_selector_map_is_not_passed_to_other_actions(registry):
+	result = await registry.execute_action('without_selector_map', {'index': 2}, browser=Mock(), selector_map={2: Mock()})
+
+	assert result == 2
+	assert registry.received['without_selector_map'] == 2